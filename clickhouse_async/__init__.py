@@ -6,13 +6,9 @@
 # trigger a circular import that fails attribute lookup.
 __version__ = "0.5.2"
 
-from clickhouse_async.client import (
-    Client,
-    ColumnarBlock,
-    ColumnarResult,
-    QueryResult,
-    connect,
-)
+import importlib
+from typing import TYPE_CHECKING
+
 from clickhouse_async.dsn import DSN, parse_dsn
 from clickhouse_async.errors import (
     ClickHouseError,
@@ -27,8 +23,45 @@ from clickhouse_async.errors import (
     ServerError,
     UnsupportedFeatureError,
 )
-from clickhouse_async.pool import Pool, create_pool
-from clickhouse_async.protocol.compression import CompressionMethod
+
+if TYPE_CHECKING:
+    from clickhouse_async.client import (
+        Client,
+        ColumnarBlock,
+        ColumnarResult,
+        QueryResult,
+        connect,
+    )
+    from clickhouse_async.pool import Pool, create_pool
+    from clickhouse_async.protocol.compression import CompressionMethod
+
+# Names whose defining module drags in asyncio, ssl and the codec
+# stack. They resolve on first attribute access (PEP 562) so that
+# `parse_dsn` / the error types stay cheap to import on their own.
+_LAZY_EXPORTS = {
+    "Client": "clickhouse_async.client",
+    "ColumnarBlock": "clickhouse_async.client",
+    "ColumnarResult": "clickhouse_async.client",
+    "QueryResult": "clickhouse_async.client",
+    "connect": "clickhouse_async.client",
+    "Pool": "clickhouse_async.pool",
+    "create_pool": "clickhouse_async.pool",
+    "CompressionMethod": "clickhouse_async.protocol.compression",
+}
+
+
+def __getattr__(name: str) -> object:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
+
 
 __all__ = [
     "DSN",
@@ -29,7 +29,9 @@
 /* Cached at module init for the lifetime of the process. */
 static PyObject *_datetime_cls = NULL;
 static PyObject *_datetime_fromtimestamp = NULL;
+static PyObject *_date_cls = NULL;
 static PyObject *_buffer_underflow_cls = NULL;
+static PyObject *_protocol_error_cls = NULL;
 
 /*
  * Raise BufferUnderflow(needed=N, available=A). The class takes
@@ -90,7 +92,8 @@ fast_read_available(PyObject *self, PyObject *args)
  * directly from `gmtime_r` components to a naive datetime — the
  * pure-Python path can't avoid that intermediate object. Aware tracks
  * roughly 1.5x faster purely from the shorter call chain (no Python
- * frame per row).
+ * frame per row). A row repeating the previous row's timestamp reuses
+ * that object outright, as `decode_date` does.
  */
 static PyObject *
 fast_read_decode_datetime(PyObject *self, PyObject *args)
@@ -127,6 +130,10 @@ fast_read_decode_datetime(PyObject *self, PyObject *args)
 
     const int aware = (tzinfo != Py_None);
     const uint8_t *data = (const uint8_t *)buffer.buf;
+    /* Event timestamps arrive in bursts (inserts stamped with `now()`,
+     * sorted keys), so a run of equal seconds shares one `datetime`. */
+    PyObject *prev = NULL;
+    uint32_t prev_ts = 0;
 
     for (Py_ssize_t i = 0; i < n_rows; i++) {
         const Py_ssize_t base = i * 4;
@@ -136,6 +143,12 @@ fast_read_decode_datetime(PyObject *self, PyObject *args)
             | ((uint32_t)data[base + 2] << 16)
             | ((uint32_t)data[base + 3] << 24);
 
+        if (prev != NULL && ts == prev_ts) {
+            Py_INCREF(prev);
+            PyList_SetItem(result, i, prev);
+            continue;
+        }
+
         PyObject *dt;
         if (aware) {
             /*
@@ -189,13 +202,131 @@ fast_read_decode_datetime(PyObject *self, PyObject *args)
             PyBuffer_Release(&buffer);
             return NULL;
         }
-        /* PyList_SetItem steals the reference on success. */
+        /* PyList_SetItem steals the reference on success; the list
+         * keeps `dt` alive, so `prev` can borrow it. */
         if (PyList_SetItem(result, i, dt) < 0) {
             /* On failure SetItem itself decrefs `dt`. */
             Py_DECREF(result);
             PyBuffer_Release(&buffer);
             return NULL;
         }
+        prev = dt;
+        prev_ts = ts;
+    }
+
+    PyBuffer_Release(&buffer);
+    return result;
+}
+
+/*
+ * decode_date(buf: bytes, n_rows: int, width: int) -> list[date]
+ *
+ * Reads `n_rows` little-endian day counts since 1970-01-01 from `buf`
+ * and returns a list of `datetime.date` objects. `width=2` is the
+ * `Date` layout (UInt16), `width=4` the `Date32` one (Int32, may be
+ * negative).
+ *
+ * Equivalent pure-Python (the path we replace):
+ *
+ *     days = struct.unpack(f"<{n_rows}H", buf[:2 * n_rows])  # or "i"
+ *     epoch = date(1970, 1, 1).toordinal()
+ *     return [date.fromordinal(epoch + d) for d in days]
+ *
+ * Days are split into (year, month, day) with the proleptic-Gregorian
+ * `civil_from_days` algorithm (H. Hinnant), so each row costs at most
+ * one `date(y, m, d)` call and no interpreter frame; a row repeating
+ * the previous row's day reuses that object outright.
+ */
+static PyObject *
+fast_read_decode_date(PyObject *self, PyObject *args)
+{
+    Py_buffer buffer;
+    Py_ssize_t n_rows;
+    int width;
+
+    if (!PyArg_ParseTuple(args, "y*ni", &buffer, &n_rows, &width)) {
+        return NULL;
+    }
+
+    if (n_rows < 0) {
+        PyBuffer_Release(&buffer);
+        PyErr_SetString(PyExc_ValueError, "n_rows must be non-negative");
+        return NULL;
+    }
+    if (width != 2 && width != 4) {
+        PyBuffer_Release(&buffer);
+        PyErr_Format(PyExc_ValueError, "width must be 2 or 4, got %d", width);
+        return NULL;
+    }
+
+    Py_ssize_t needed = n_rows * width;
+    if (buffer.len < needed) {
+        PyBuffer_Release(&buffer);
+        PyErr_Format(
+            PyExc_ValueError,
+            "buffer too short: need %zd bytes, got %zd",
+            needed, buffer.len);
+        return NULL;
+    }
+
+    PyObject *result = PyList_New(n_rows);
+    if (result == NULL) {
+        PyBuffer_Release(&buffer);
+        return NULL;
+    }
+
+    const uint8_t *data = (const uint8_t *)buffer.buf;
+    /* Date columns are usually clustered (partitioned or sorted by
+     * day), so a run of equal days shares one immutable `date`. */
+    PyObject *prev = NULL;
+    int64_t prev_days = 0;
+
+    for (Py_ssize_t i = 0; i < n_rows; i++) {
+        const uint8_t *p = data + i * width;
+        int64_t days;
+        if (width == 2) {
+            days = (int64_t)((uint16_t)p[0] | ((uint16_t)p[1] << 8));
+        } else {
+            days = (int64_t)(int32_t)(
+                (uint32_t)p[0]
+                | ((uint32_t)p[1] << 8)
+                | ((uint32_t)p[2] << 16)
+                | ((uint32_t)p[3] << 24));
+        }
+
+        if (prev != NULL && days == prev_days) {
+            Py_INCREF(prev);
+            PyList_SetItem(result, i, prev);
+            continue;
+        }
+
+        /* civil_from_days: shift the epoch to 0000-03-01 so leap days
+         * fall at the end of the 400-year era. */
+        const int64_t z = days + 719468;
+        const int64_t era = (z >= 0 ? z : z - 146096) / 146097;
+        const int64_t doe = z - era * 146097;
+        const int64_t yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+        const int64_t doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+        const int64_t mp = (5 * doy + 2) / 153;
+        const int day = (int)(doy - (153 * mp + 2) / 5 + 1);
+        const int month = (int)(mp < 10 ? mp + 3 : mp - 9);
+        const int year = (int)(yoe + era * 400 + (month <= 2));
+
+        PyObject *d = PyObject_CallFunction(
+            _date_cls, "iii", year, month, day);
+        if (d == NULL) {
+            Py_DECREF(result);
+            PyBuffer_Release(&buffer);
+            return NULL;
+        }
+        /* PyList_SetItem steals the reference on success. */
+        if (PyList_SetItem(result, i, d) < 0) {
+            Py_DECREF(result);
+            PyBuffer_Release(&buffer);
+            return NULL;
+        }
+        prev = d;
+        prev_days = days;
     }
 
     PyBuffer_Release(&buffer);
@@ -334,9 +465,112 @@ fast_read_decode_strings(PyObject *self, PyObject *args)
     return Py_BuildValue("(Nn)", result, pos);
 }
 
+/*
+ * decode_varuint(buf: bytes, pos: int) -> tuple[int, int]
+ *
+ * Decodes one LEB128 varuint starting at `buf[pos]`. Returns the value
+ * and the byte position right after it.
+ *
+ * When at least 8 bytes are buffered the terminator is found SWAR-
+ * style: load the 8 bytes as one little-endian word, invert and mask
+ * the continuation bits, and count trailing zeros to get the length.
+ * The 7-bit groups are then packed with three shift/mask rounds — the
+ * portable form of a `pext` against 0x7f7f... (no BMI2 needed, so one
+ * abi3 wheel still covers every x86_64 CPU). 9- and 10-byte encodings,
+ * short tails, and big-endian / non-GCC builds use the scalar loop.
+ *
+ * Raises `BufferUnderflow(needed=1, available=0)` when the buffer ends
+ * mid-varuint — the same sentinel `SyncBinaryReader.read_byte` raises —
+ * and `ProtocolError` past the 10-byte cap or when the 10th byte
+ * carries bits beyond bit 63.
+ */
+#define VARUINT_MAX_BYTES 10
+#define VARUINT_LAST_SHIFT ((VARUINT_MAX_BYTES - 1) * 7)
+#define VARUINT_MSB_MASK 0x8080808080808080ULL
+#define VARUINT_PAYLOAD_MASK 0x7f7f7f7f7f7f7f7fULL
+
+#if defined(__GNUC__) && defined(__BYTE_ORDER__) \
+    && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+#define VARUINT_HAVE_SWAR 1
+#endif
+
+static PyObject *
+fast_read_decode_varuint(PyObject *self, PyObject *args)
+{
+    Py_buffer buffer;
+    Py_ssize_t pos;
+
+    if (!PyArg_ParseTuple(args, "y*n", &buffer, &pos)) {
+        return NULL;
+    }
+    if (pos < 0 || pos > buffer.len) {
+        PyBuffer_Release(&buffer);
+        PyErr_SetString(PyExc_ValueError, "pos out of range");
+        return NULL;
+    }
+
+    const uint8_t *data = (const uint8_t *)buffer.buf;
+    const Py_ssize_t buflen = buffer.len;
+    uint64_t value = 0;
+
+#ifdef VARUINT_HAVE_SWAR
+    if (buflen - pos >= 8) {
+        uint64_t w;
+        memcpy(&w, data + pos, 8);
+        const uint64_t stops = ~w & VARUINT_MSB_MASK;
+        if (stops != 0) {
+            const int n_bytes = __builtin_ctzll(stops) / 8 + 1;
+            uint64_t x = w & VARUINT_PAYLOAD_MASK;
+            if (n_bytes < 8) {
+                x &= (1ULL << (n_bytes * 8)) - 1;
+            }
+            x = (x & 0x007f007f007f007fULL) | ((x & 0x7f007f007f007f00ULL) >> 1);
+            x = (x & 0x00003fff00003fffULL) | ((x & 0x3fff00003fff0000ULL) >> 2);
+            x = (x & 0x000000000fffffffULL) | ((x & 0x0fffffff00000000ULL) >> 4);
+            PyBuffer_Release(&buffer);
+            return Py_BuildValue("(Kn)", (unsigned long long)x, pos + n_bytes);
+        }
+    }
+#endif
+
+    for (int shift = 0; shift < VARUINT_MAX_BYTES * 7; shift += 7) {
+        if (pos >= buflen) {
+            PyBuffer_Release(&buffer);
+            raise_buffer_underflow(1, 0);
+            return NULL;
+        }
+        const uint8_t b = data[pos++];
+        /* The 10th byte sits at bit 63: only its lowest payload bit
+         * fits in a UInt64. Anything more would be silently shifted
+         * out, so reject it rather than return a truncated value. */
+        if (shift == VARUINT_LAST_SHIFT && (b & 0x7F) > 1) {
+            PyBuffer_Release(&buffer);
+            PyErr_Format(
+                _protocol_error_cls,
+                "varuint exceeds 64 bits at offset %zd", pos);
+            return NULL;
+        }
+        value |= ((uint64_t)(b & 0x7F)) << shift;
+        if (b < 0x80) {
+            PyBuffer_Release(&buffer);
+            return Py_BuildValue("(Kn)", (unsigned long long)value, pos);
+        }
+    }
+
+    PyBuffer_Release(&buffer);
+    PyErr_Format(
+        _protocol_error_cls,
+        "varuint exceeds %d bytes at offset %zd", VARUINT_MAX_BYTES, pos);
+    return NULL;
+}
+
 static PyMethodDef FastReadMethods[] = {
     {"available", fast_read_available, METH_NOARGS,
      "Return True. Smoke test that the C extension was built and loaded."},
+    {"decode_date", fast_read_decode_date, METH_VARARGS,
+     "decode_date(buf, n_rows, width) -> list[date].\n\n"
+     "Decode a column of LE day counts since the epoch into a list of\n"
+     "date objects. width=2 for Date (UInt16), 4 for Date32 (Int32)."},
     {"decode_datetime", fast_read_decode_datetime, METH_VARARGS,
      "decode_datetime(buf, n_rows, tzinfo) -> list[datetime].\n\n"
      "Decode a column of UInt32 LE Unix timestamps into a list of datetime\n"
@@ -346,6 +580,11 @@ static PyMethodDef FastReadMethods[] = {
      "Walks n_rows varuint-prefixed UTF-8 strings starting at buf[pos]\n"
      "and returns the list together with the new position. Raises\n"
      "BufferUnderflow on short buffer."},
+    {"decode_varuint", fast_read_decode_varuint, METH_VARARGS,
+     "decode_varuint(buf, pos) -> tuple[int, int].\n\n"
+     "Decodes one LEB128 varuint at buf[pos] and returns the value\n"
+     "together with the new position. Raises BufferUnderflow on short\n"
+     "buffer."},
     {NULL, NULL, 0, NULL}
 };
 
@@ -378,8 +617,11 @@ PyInit__fast_read(void)
         return NULL;
     }
     _datetime_cls = PyObject_GetAttrString(datetime_module, "datetime");
+    _date_cls = PyObject_GetAttrString(datetime_module, "date");
     Py_DECREF(datetime_module);
-    if (_datetime_cls == NULL) {
+    if (_datetime_cls == NULL || _date_cls == NULL) {
+        Py_CLEAR(_datetime_cls);
+        Py_CLEAR(_date_cls);
         Py_DECREF(m);
         return NULL;
     }
@@ -387,29 +629,36 @@ PyInit__fast_read(void)
         _datetime_cls, "fromtimestamp");
     if (_datetime_fromtimestamp == NULL) {
         Py_CLEAR(_datetime_cls);
+        Py_CLEAR(_date_cls);
         Py_DECREF(m);
         return NULL;
     }
 
-    /* Cache `clickhouse_async.protocol.io_sync.BufferUnderflow` for
-     * raising the same sentinel the pure-Python codecs do — the outer
-     * `read_block_buffered` retry loop pattern-matches on this exact
-     * type. Without it, `decode_strings` would segfault calling NULL
-     * when it hits a short buffer. */
-    PyObject *io_sync_module = PyImport_ImportModule(
-        "clickhouse_async.protocol.io_sync");
-    if (io_sync_module == NULL) {
+    /* Cache `BufferUnderflow` for raising the same sentinel the
+     * pure-Python codecs do — the outer `read_block_buffered` retry
+     * loop pattern-matches on this exact type — and `ProtocolError`
+     * for the varuint length cap. Both come from the leaf
+     * `clickhouse_async.errors` module: importing `protocol.io_sync`
+     * here would cycle back into this module, since io_sync imports
+     * `_fast_read`. */
+    PyObject *errors_module = PyImport_ImportModule("clickhouse_async.errors");
+    if (errors_module == NULL) {
         Py_CLEAR(_datetime_cls);
+        Py_CLEAR(_date_cls);
         Py_CLEAR(_datetime_fromtimestamp);
         Py_DECREF(m);
         return NULL;
     }
     _buffer_underflow_cls = PyObject_GetAttrString(
-        io_sync_module, "BufferUnderflow");
-    Py_DECREF(io_sync_module);
-    if (_buffer_underflow_cls == NULL) {
+        errors_module, "BufferUnderflow");
+    _protocol_error_cls = PyObject_GetAttrString(errors_module, "ProtocolError");
+    Py_DECREF(errors_module);
+    if (_buffer_underflow_cls == NULL || _protocol_error_cls == NULL) {
         Py_CLEAR(_datetime_cls);
+        Py_CLEAR(_date_cls);
         Py_CLEAR(_datetime_fromtimestamp);
+        Py_CLEAR(_buffer_underflow_cls);
+        Py_CLEAR(_protocol_error_cls);
         Py_DECREF(m);
         return NULL;
     }
@@ -11,7 +11,7 @@ Keep the signatures in lockstep with the ``PyMethodDef`` table in
 
 from __future__ import annotations
 
-from datetime import datetime, tzinfo
+from datetime import date, datetime, tzinfo
 
 __version__: str
 
@@ -31,6 +31,20 @@ def decode_strings(
     short buffer — same sentinel the rest of the read path raises.
     """
 
+def decode_varuint(buf: bytes, pos: int) -> tuple[int, int]:
+    """Decode one LEB128 varuint at ``buf[pos]``. Returns the value
+    together with the byte position right after it.
+
+    Raises ``BufferUnderflow`` when the buffer ends mid-varuint and
+    ``ProtocolError`` past the 10-byte cap.
+    """
+
+def decode_date(buf: bytes, n_rows: int, width: int) -> list[date]:
+    """Decode ``n_rows`` little-endian day counts since 1970-01-01 into
+    ``date`` objects. ``width`` is 2 for ``Date`` (UInt16) and 4 for
+    ``Date32`` (Int32).
+    """
+
 def decode_datetime(
     buf: bytes,
     n_rows: int,
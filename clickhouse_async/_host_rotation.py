@@ -35,6 +35,7 @@ class _HostRotation:
         if cooldown < 0:
             raise ValueError(f"cooldown must be ≥ 0, got {cooldown}")
         self._hosts: tuple[tuple[str, int], ...] = tuple(hosts)
+        self._known: frozenset[tuple[str, int]] = frozenset(self._hosts)
         self._cooldown = cooldown
         self._failures: dict[tuple[str, int], float] = {}
         self._next_start: int = 0
@@ -58,11 +59,12 @@ class _HostRotation:
           effort, not a hard wait.
         """
         now = time.monotonic()
-        n = len(self._hosts)
-        rotated: list[tuple[str, int]] = [
-            self._hosts[(self._next_start + i) % n] for i in range(n)
-        ]
-        self._next_start = (self._next_start + 1) % n
+        start = self._next_start
+        # Two tuple slices rotate in C; no per-index modulo arithmetic.
+        rotated = self._hosts[start:] + self._hosts[:start]
+        self._next_start = (start + 1) % len(self._hosts)
+        if not self._failures:
+            return rotated
 
         # A host is eligible if it has no recorded failure, or if its
         # failure timestamp is older than the cooldown window. Falling
@@ -75,13 +77,13 @@ class _HostRotation:
             last_failure = self._failures.get(host)
             if last_failure is None or (now - last_failure) >= self._cooldown:
                 eligible.append(host)
-        return tuple(eligible) if eligible else tuple(rotated)
+        return tuple(eligible) if eligible else rotated
 
     def record_failure(self, host: tuple[str, int]) -> None:
         """Mark `host` as recently-failed. The next `cooldown`
         seconds of rotations will skip it (unless every host is in
         cooldown)."""
-        if host not in set(self._hosts):
+        if host not in self._known:
             # Unknown host — defensive; the caller is the Connection
             # which only sees what we hand it, so this shouldn't happen.
             return
@@ -43,7 +43,7 @@ if TYPE_CHECKING:
     from clickhouse_async.protocol.handshake import ServerInfo
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryResult:
     """Outcome of an `execute()` call.
 
@@ -82,7 +82,7 @@ class QueryResult:
         return len(self.rows)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnarBlock:
     """One server block yielded by `iter_column_blocks`, column-major.
 
@@ -332,11 +332,19 @@ class Client:
         settings: Mapping[str, str] | None = None,
         query_id: str = "",
     ) -> tuple[object, ...] | None:
-        """Run `sql` and return the first row, or `None` if empty."""
-        rows = await self.fetch_all(
+        """Run `sql` and return the first row, or `None` if empty.
+
+        The response is still drained to `EndOfStream`, but only the
+        first row is ever transposed — later blocks are dropped as they
+        arrive rather than collected into a full row list.
+        """
+        first: tuple[object, ...] | None = None
+        async for block in self.iter_blocks(
             sql, params=params, settings=settings, query_id=query_id
-        )
-        return rows[0] if rows else None
+        ):
+            if first is None:
+                first = tuple(column[0] for column in block.data)
+        return first
 
     # ---- streaming -------------------------------------------------------
 
@@ -457,8 +465,16 @@ class Client:
                     accum = [[] for _ in columns]
                 if block.n_rows == 0:
                     continue
-                for i, col_data in enumerate(block.data):
-                    accum[i].extend(col_data)
+                if total_rows == 0:
+                    # The block is dropped after this iteration, so its
+                    # decoded column lists can be adopted as-is — a
+                    # single-block result is never copied.
+                    accum = [
+                        col if type(col) is list else list(col) for col in block.data
+                    ]
+                else:
+                    for i, col_data in enumerate(block.data):
+                        accum[i].extend(col_data)
                 total_rows += block.n_rows
         finally:
             self._conn.on_progress = prior_progress
@@ -603,9 +619,9 @@ class Client:
         batch: list[Sequence[object]] = []
         n_columns = len(header.columns)
 
-        async def _flush(batch: list[Sequence[object]]) -> int:
+        async def _flush(batch: list[Sequence[object]], *, last: bool = False) -> int:
             block = _build_insert_block(header.columns, batch)  # type: ignore[union-attr]
-            await self._conn.send_data(block)
+            await self._conn.send_data(block, last=last)
             return len(batch)
 
         try:
@@ -643,12 +659,13 @@ class Client:
                     if len(batch) >= insert_block_size:
                         client_sent_rows += await _flush(batch)
                         batch = []
-            if batch:
-                client_sent_rows += await _flush(batch)
-
             # Empty terminator block tells the server the INSERT payload is
-            # complete; the server then emits Progress / EndOfStream.
-            await self._conn.send_data(None)
+            # complete; the server then emits Progress / EndOfStream. A
+            # trailing partial batch carries it in the same write.
+            if batch:
+                client_sent_rows += await _flush(batch, last=True)
+            else:
+                await self._conn.send_data(None)
 
             # Drain remaining packets (Progress / EndOfStream / etc.).
             async for _ in iterator:
@@ -688,8 +705,10 @@ class Client:
         )
         try:
             async for block in inner:
-                for i in range(block.n_rows):
-                    yield tuple(col[i] for col in block.data)
+                # `zip` transposes lazily in C: one row tuple at a time,
+                # so memory stays bounded by the current block.
+                for row in zip(*block.data, strict=False):
+                    yield row
         finally:
             await inner.aclose()
 
@@ -747,36 +766,6 @@ class Client:
             return result.row_count
 
 
-async def _async_rows(
-    rows: AsyncIterable[Sequence[object]],
-) -> AsyncGenerator[Sequence[object], None]:
-    async for row in rows:
-        yield row
-
-
-async def _sync_rows(
-    rows: Iterable[Sequence[object]],
-) -> AsyncGenerator[Sequence[object], None]:
-    for row in rows:
-        yield row
-
-
-def _normalise_row_source(
-    rows: Iterable[Sequence[object]] | AsyncIterable[Sequence[object]],
-) -> AsyncGenerator[Sequence[object], None]:
-    """Wrap a sync or async iterable in a uniform async-generator
-    interface so the insert loop can `async for` over either shape.
-
-    Split into two single-purpose helpers because narrowing a
-    sync-or-async-iterable union inside one function loses the
-    parametric element type at the iteration site (ty observes
-    `object` rather than `Sequence[object]`). The `cast` calls
-    re-attach the parameter ty's isinstance narrowing strips off."""
-    if isinstance(rows, AsyncIterable):
-        return _async_rows(cast("AsyncIterable[Sequence[object]]", rows))
-    return _sync_rows(cast("Iterable[Sequence[object]]", rows))
-
-
 async def _enumerate_async(
     source: AsyncIterable[Sequence[object]],
 ) -> AsyncGenerator[tuple[int, Sequence[object]], None]:
@@ -37,12 +37,14 @@ import importlib
 import logging
 import os
 import ssl as _ssl_module
+from collections import deque
 from collections.abc import AsyncIterator, Awaitable, Callable, Mapping, Sequence
 from dataclasses import dataclass
 from enum import IntEnum
 from typing import Literal, Protocol
 
 from clickhouse_async.errors import (
+    ClickHouseError,
     ConcurrentQueryError,
     ConnectError,
     ProtocolError,
@@ -88,6 +90,11 @@ from clickhouse_async.protocol.server_packets import (
 
 _logger = logging.getLogger(__name__)
 
+# How many state transitions a connection remembers. Every query adds
+# two, so an unbounded history grows for as long as a pooled connection
+# lives; the tail is all the debugging breadcrumb ever needs.
+_TRANSITION_HISTORY = 64
+
 
 def _default_compression() -> CompressionMethod:
     """Return the auto-detected default compression method.
@@ -122,8 +129,31 @@ class State(IntEnum):
 
 BlockKind = Literal["data", "totals", "extremes"]
 
-
-@dataclass
+# Packet id -> kind tag for the block-bearing packets `iter_packets`
+# yields. One dict probe routes all three (DATA first of all) instead
+# of walking an if/elif chain of enum comparisons per packet.
+_BLOCK_PACKET_KINDS: dict[int, BlockKind] = {
+    ServerPacket.DATA.value: "data",
+    ServerPacket.TOTALS.value: "totals",
+    ServerPacket.EXTREMES.value: "extremes",
+}
+# Plain-int copies of the remaining ids `iter_packets` tests per packet.
+# `ServerPacket.X` is an enum-class attribute lookup on every compare;
+# a module-global int is a dict hit and an int-to-int `==`. The enum
+# stays the source of truth (and the thing error messages name).
+_PKT_END_OF_STREAM = ServerPacket.END_OF_STREAM.value
+_PKT_EXCEPTION = ServerPacket.EXCEPTION.value
+_PKT_PROGRESS = ServerPacket.PROGRESS.value
+_PKT_PROFILE_INFO = ServerPacket.PROFILE_INFO.value
+_PKT_PROFILE_EVENTS = ServerPacket.PROFILE_EVENTS.value
+_PKT_LOG = ServerPacket.LOG.value
+_PKT_TABLE_COLUMNS = ServerPacket.TABLE_COLUMNS.value
+_PKT_TIMEZONE_UPDATE = ServerPacket.TIMEZONE_UPDATE.value
+# Ping has no body: the whole packet is its one-byte varuint id.
+_PING_PACKET = bytes([ClientPacket.PING])
+
+
+@dataclass(slots=True)
 class StreamedBlock:
     """A block yielded by `iter_packets` together with its kind tag.
 
@@ -144,7 +174,7 @@ class _WriterLike(Protocol):
     we can drive the connection without a real socket.
     """
 
-    def write(self, data: bytes) -> None: ...
+    def write(self, data: bytes | memoryview) -> None: ...
     def close(self) -> None: ...
     def is_closing(self) -> bool: ...
     async def drain(self) -> None: ...
@@ -157,6 +187,19 @@ TransportFactory = Callable[
 ]
 
 
+# `StreamReader` flow control pauses the socket once more than twice
+# its `limit` is buffered. At asyncio's 64 KiB default a multi-MiB
+# result block bounces through pause/resume (and an epoll re-arm)
+# every 128 KiB; a larger limit lets the selector keep draining the
+# socket in full-size reads while the codecs decode.
+_STREAM_READ_LIMIT = 256 * 1024
+# RFC 8305's recommended "Connection Attempt Delay". When a hostname
+# resolves to several addresses (dual-stack IPv6/IPv4, round-robin
+# DNS) asyncio races them, starting the next attempt after this delay
+# instead of waiting out a blackholed address's full TCP timeout.
+_HAPPY_EYEBALLS_DELAY = 0.25
+
+
 async def _default_transport_factory(
     host: str,
     port: int,
@@ -164,7 +207,13 @@ async def _default_transport_factory(
 ) -> tuple[
     asyncio.StreamReader, _WriterLike
 ]:  # pragma: no cover — real socket; integration tests only
-    return await asyncio.open_connection(host, port, ssl=ssl_context)
+    return await asyncio.open_connection(
+        host,
+        port,
+        ssl=ssl_context,
+        limit=_STREAM_READ_LIMIT,
+        happy_eyeballs_delay=_HAPPY_EYEBALLS_DELAY,
+    )
 
 
 class Connection:
@@ -182,6 +231,32 @@ class Connection:
     the host is treated as a failure and the next candidate is tried.
     """
 
+    __slots__ = (
+        "_cancel_in_flight",
+        "_compression",
+        "_connect_timeout",
+        "_connected_host",
+        "_hosts",
+        "_json_nested",
+        "_negotiated_revision",
+        "_on_host_attempt",
+        "_reader",
+        "_server_info",
+        "_session_timezone",
+        "_ssl_context",
+        "_state",
+        "_transitions",
+        "_transport_factory",
+        "_user",
+        "_writer",
+        "on_log",
+        "on_profile_events",
+        "on_profile_info",
+        "on_progress",
+        "on_table_columns",
+        "on_timezone_update",
+    )
+
     def __init__(
         self,
         hosts: Sequence[tuple[str, int]],
@@ -241,7 +316,9 @@ class Connection:
         self._json_nested: bool = json_nested
         # (from_state, to_state, reason) per transition — load-bearing for
         # tests and a useful debugging breadcrumb in production logs.
-        self._transitions: list[tuple[State, State, str]] = []
+        self._transitions: deque[tuple[State, State, str]] = deque(
+            maxlen=_TRANSITION_HISTORY
+        )
 
     # ---- introspection ---------------------------------------------------
 
@@ -274,8 +351,9 @@ class Connection:
 
     @property
     def transitions(self) -> list[tuple[State, State, str]]:
-        """Read-only view of the state transitions this connection has
-        gone through. Tests use this to assert the right reasons fired."""
+        """Read-only view of the most recent state transitions (up to
+        `_TRANSITION_HISTORY`) this connection has gone through. Tests
+        use this to assert the right reasons fired."""
         return list(self._transitions)
 
     @property
@@ -364,7 +442,10 @@ class Connection:
                 )
                 await self._cleanup_writer()
                 raise
-            except BaseException as exc:
+            except (ClickHouseError, OSError) as exc:
+                # Transport errors (refused / reset / TLS / DNS /
+                # timeout are all OSError) and server-side or protocol
+                # rejections count against this host only.
                 host_errors.append((host, port, "connect", exc))
                 if self._on_host_attempt is not None:
                     self._on_host_attempt((host, port), exc)
@@ -372,6 +453,14 @@ class Connection:
                 # starts from a clean slate.
                 await self._cleanup_writer()
                 continue
+            except BaseException as exc:
+                # Anything else is a bug or an interrupt, not a dead
+                # replica — don't mask it by trying the next candidate.
+                self._transition(
+                    State.BROKEN, f"connect aborted for {host}:{port}: {exc!r}"
+                )
+                await self._cleanup_writer()
+                raise
             # Success.
             self._connected_host = (host, port)
             if self._on_host_attempt is not None:
@@ -508,7 +597,9 @@ class Connection:
             compression=self._compression,
         )
         try:
-            self._writer.write(out.getvalue())
+            # Hand over the packet buffer itself; a long SQL text would
+            # otherwise be copied once more by `getvalue`.
+            self._writer.write(out.getbuffer())
             await self._writer.drain()
         except BaseException as exc:
             self._transition(State.BROKEN, f"send_query write failed: {exc!r}")
@@ -519,11 +610,13 @@ class Connection:
             f"send_query(query_id={query_id!r}, len(sql)={len(sql)})",
         )
 
-    async def send_data(self, block: Block | None) -> None:
+    async def send_data(self, block: Block | None, *, last: bool = False) -> None:
         """Send a Data packet during an INSERT.
 
         Pass `None` for the empty-block terminator that signals
-        end-of-data. State stays IN_FLIGHT — the call returns to READY
+        end-of-data, or `last=True` to append that terminator to
+        `block`'s packet so both leave in one transport write and one
+        `drain`. State stays IN_FLIGHT — the call returns to READY
         only when the user resumes `iter_packets` and the server
         emits `EndOfStream`.
 
@@ -540,16 +633,21 @@ class Connection:
         assert self._writer is not None
 
         out = BinaryWriter()
-        out.write_varuint(ClientPacket.DATA)
-        out.write_string("")  # external table name (empty = main table)
-        write_block_framed(
-            out,
-            block if block is not None else Block(info=BlockInfo()),
-            revision=self._negotiated_revision,
-            compression=self._compression,
-        )
+        blocks = [block if block is not None else Block(info=BlockInfo())]
+        if last and block is not None:
+            blocks.append(Block(info=BlockInfo()))
+        for b in blocks:
+            out.write_varuint(ClientPacket.DATA)
+            out.write_string("")  # external table name (empty = main table)
+            write_block_framed(
+                out,
+                b,
+                revision=self._negotiated_revision,
+                compression=self._compression,
+            )
         try:
-            self._writer.write(out.getvalue())
+            # Data blocks run to megabytes; skip the `bytes` copy.
+            self._writer.write(out.getbuffer())
             await self._writer.drain()
         except BaseException as exc:
             self._transition(State.BROKEN, f"send_data write failed: {exc!r}")
@@ -569,10 +667,8 @@ class Connection:
             raise RuntimeError(f"ping() requires READY state, got {self._state.name}")
         assert self._reader is not None and self._writer is not None
 
-        out = BinaryWriter()
-        out.write_varuint(ClientPacket.PING)
         try:
-            self._writer.write(out.getvalue())
+            self._writer.write(_PING_PACKET)
             await self._writer.drain()
         except BaseException as exc:
             self._transition(State.BROKEN, f"ping send failed: {exc!r}")
@@ -589,6 +685,9 @@ class Connection:
             self._transition(
                 State.BROKEN, f"unexpected packet id {packet_id} after Ping"
             )
+            # Close the socket like the IO-failure paths above do —
+            # the stream is desynchronised, nothing can reuse it.
+            await self._cleanup_writer()
             raise ProtocolError(
                 f"expected PONG ({int(ServerPacket.PONG)}) after Ping, "
                 f"got packet id {packet_id}"
@@ -709,6 +808,10 @@ class Connection:
                 f"iter_packets() requires IN_FLIGHT state, got {self._state.name}"
             )
         assert self._reader is not None
+        # Loop invariants, hoisted so the per-packet path reads locals
+        # rather than re-fetching connection attributes.
+        reader = self._reader
+        json_nested = self._json_nested
         revision = self._negotiated_revision
         # DATA / TOTALS / EXTREMES blocks travel through the connection's
         # negotiated compression. LOG / PROFILE_EVENTS were always raw
@@ -725,69 +828,53 @@ class Connection:
                 # Re-read on each iteration so a TIMEZONE_UPDATE packet
                 # mid-query updates the codec's view for subsequent blocks.
                 session_tz = self._session_timezone
-                json_nested = self._json_nested
-                packet_id = await self._reader.read_varuint()
-                if packet_id == ServerPacket.DATA:
+                packet_id = reader.try_read_small_varuint()
+                if packet_id is None:
+                    packet_id = await reader.read_varuint()
+                kind = _BLOCK_PACKET_KINDS.get(packet_id)
+                if kind is not None:
                     _, block = await read_block_packet_body(
-                        self._reader,
+                        reader,
                         revision=revision,
                         compression=compression,
                         session_timezone=session_tz,
                         json_nested=json_nested,
                     )
-                    yield StreamedBlock(kind="data", block=block)
-                elif packet_id == ServerPacket.TOTALS:
-                    _, block = await read_block_packet_body(
-                        self._reader,
-                        revision=revision,
-                        compression=compression,
-                        session_timezone=session_tz,
-                        json_nested=json_nested,
-                    )
-                    yield StreamedBlock(kind="totals", block=block)
-                elif packet_id == ServerPacket.EXTREMES:
-                    _, block = await read_block_packet_body(
-                        self._reader,
-                        revision=revision,
-                        compression=compression,
-                        session_timezone=session_tz,
-                        json_nested=json_nested,
-                    )
-                    yield StreamedBlock(kind="extremes", block=block)
-                elif packet_id == ServerPacket.END_OF_STREAM:
+                    yield StreamedBlock(kind=kind, block=block)
+                elif packet_id == _PKT_END_OF_STREAM:
                     self._transition(State.READY, "EndOfStream")
                     return
-                elif packet_id == ServerPacket.EXCEPTION:
-                    err = await read_exception_body(self._reader)
+                elif packet_id == _PKT_EXCEPTION:
+                    err = await read_exception_body(reader)
                     self._transition(State.READY, f"server exception: {err.name}")
                     raise err
-                elif packet_id == ServerPacket.PROGRESS:
-                    progress = await read_progress(self._reader, revision=revision)
+                elif packet_id == _PKT_PROGRESS:
+                    progress = await read_progress(reader, revision=revision)
                     if self.on_progress is not None:
                         self.on_progress(progress)
-                elif packet_id == ServerPacket.PROFILE_INFO:
-                    pinfo = await read_profile_info(self._reader, revision=revision)
+                elif packet_id == _PKT_PROFILE_INFO:
+                    pinfo = await read_profile_info(reader, revision=revision)
                     if self.on_profile_info is not None:
                         self.on_profile_info(pinfo)
-                elif packet_id == ServerPacket.PROFILE_EVENTS:
+                elif packet_id == _PKT_PROFILE_EVENTS:
                     _, block = await read_block_packet_body(
-                        self._reader,
+                        reader,
                         revision=revision,
                         compression=aux_compression,
                         session_timezone=session_tz,
                     )
                     if self.on_profile_events is not None:
                         self.on_profile_events(block)
-                elif packet_id == ServerPacket.LOG:
+                elif packet_id == _PKT_LOG:
                     _, block = await read_block_packet_body(
-                        self._reader,
+                        reader,
                         revision=revision,
                         compression=aux_compression,
                         session_timezone=session_tz,
                     )
                     if self.on_log is not None:
                         self.on_log(block)
-                elif packet_id == ServerPacket.TABLE_COLUMNS:
+                elif packet_id == _PKT_TABLE_COLUMNS:
                     # At revision 54481+, the TABLE_COLUMNS body is wrapped in
                     # a compressed frame when compression is active (same gate
                     # as LOG / PROFILE_EVENTS, per Protocol.h).
@@ -797,16 +884,14 @@ class Connection:
                         and compression != CompressionMethod.NONE
                     ):
                         default_table_name, columns = await read_table_columns(
-                            _MultiFrameReader(self._reader)
+                            _MultiFrameReader(reader)
                         )
                     else:
-                        default_table_name, columns = await read_table_columns(
-                            self._reader
-                        )
+                        default_table_name, columns = await read_table_columns(reader)
                     if self.on_table_columns is not None:
                         self.on_table_columns(default_table_name, columns)
-                elif packet_id == ServerPacket.TIMEZONE_UPDATE:
-                    tz = await read_timezone_update(self._reader)
+                elif packet_id == _PKT_TIMEZONE_UPDATE:
+                    tz = await read_timezone_update(reader)
                     # Capture before firing the user callback so a hook
                     # that introspects `conn.session_timezone` sees the
                     # new value, not the stale one.
@@ -889,6 +974,9 @@ class Connection:
         old = self._state
         self._state = new_state
         self._transitions.append((old, new_state, reason))
-        _logger.debug(
-            "connection state %s -> %s (%s)", old.name, new_state.name, reason
-        )
+        # Every query goes through two transitions; skip the enum `.name`
+        # lookups (evaluated eagerly as call arguments) when DEBUG is off.
+        if _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "connection state %s -> %s (%s)", old.name, new_state.name, reason
+            )
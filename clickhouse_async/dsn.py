@@ -29,10 +29,14 @@ map and is forwarded to the server alongside each query.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from urllib.parse import parse_qs, unquote, urlparse
+import re
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from urllib.parse import unquote, unquote_plus
 
-from clickhouse_async.protocol.compression import CompressionMethod
+if TYPE_CHECKING:
+    from clickhouse_async.protocol.compression import CompressionMethod
 
 DEFAULT_PORT = 9000
 DEFAULT_SECURE_PORT = 9440
@@ -42,8 +46,31 @@ DEFAULT_CONNECT_TIMEOUT = 10.0
 # Inclusive upper bound on TCP port numbers per RFC 6335.
 _MAX_TCP_PORT = 65535
 
-
-@dataclass(frozen=True)
+# Distinct DSN strings kept parsed. Pools and short-lived clients
+# usually re-parse the same handful of strings over and over.
+_PARSE_CACHE_SIZE = 256
+
+# `urlsplit`'s input cleanup, applied before `_DSN_RE`: leading C0
+# control characters and spaces are dropped, and ASCII tab / CR / LF
+# are removed wherever they occur, so a DSN read from an env var or a
+# file with a trailing newline parses as if the newline weren't there.
+_LEADING_JUNK = "".join(map(chr, range(0x21)))
+_REMOVE_UNSAFE = str.maketrans("", "", "\t\r\n")
+
+# One-pass split of a DSN into scheme / userinfo / host list / path /
+# query. Mirrors `urlsplit`'s grammar (netloc stops at the first `/`,
+# `?` or `#`; the greedy userinfo group backtracks to the *last* `@`)
+# without its per-call state machine. The pattern always matches —
+# every group is optional — so validation happens on the captures.
+_DSN_RE = re.compile(
+    r"^(?:(?P<scheme>[^:/?#]+):)?"
+    r"(?://(?:(?P<userinfo>[^/?#]*)@)?(?P<hosts>[^/?#]*))?"
+    r"(?P<path>[^?#]*)"
+    r"(?:\?(?P<query>[^#]*))?"
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DSN:
     """Parsed DSN. `parse_dsn` is the only documented constructor.
 
@@ -77,27 +104,35 @@ def parse_dsn(dsn: str) -> DSN:
 
     Raises `ValueError` for unsupported schemes, missing host, malformed
     host:port pieces, or malformed query-parameter values.
+
+    Results are memoised per DSN string; each call still gets its own
+    `settings` dict so a caller mutating it can't leak into the cache.
     """
-    parsed = urlparse(dsn)
-    if parsed.scheme not in ("clickhouse", "clickhouses"):
+    parsed = _parse_dsn_cached(dsn)
+    return replace(parsed, settings=dict(parsed.settings))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_dsn_cached(dsn: str) -> DSN:
+    """Uncached parse. Errors propagate and are not memoised."""
+    match = _DSN_RE.match(dsn.lstrip(_LEADING_JUNK).translate(_REMOVE_UNSAFE))
+    if match is None:  # pragma: no cover — every group is optional
+        raise ValueError(f"malformed DSN: {dsn!r}")
+    scheme, userinfo, host_part, path, raw_query = match.group(
+        "scheme", "userinfo", "hosts", "path", "query"
+    )
+    scheme = (scheme or "").lower()
+    if scheme not in ("clickhouse", "clickhouses"):
         raise ValueError(
-            f"unsupported DSN scheme {parsed.scheme!r} "
+            f"unsupported DSN scheme {scheme!r} "
             f"(expected 'clickhouse' or 'clickhouses')"
         )
 
-    query = parse_qs(parsed.query, keep_blank_values=True)
+    query = _parse_query(raw_query or "")
 
-    secure = parsed.scheme == "clickhouses" or _parse_bool(
-        _take_one(query, "secure", "false")
-    )
+    secure = scheme == "clickhouses" or _parse_bool(query.get("secure", "false"))
     default_port = DEFAULT_SECURE_PORT if secure else DEFAULT_PORT
 
-    # urlparse's `.hostname` / `.port` choke on multi-host netlocs (it
-    # splits on the first colon and trips on the comma). We re-derive
-    # the host portion by hand: strip the userinfo prefix off the
-    # netloc, then split the remainder on top-level commas.
-    netloc = parsed.netloc
-    host_part = netloc.rsplit("@", 1)[-1] if "@" in netloc else netloc
     if not host_part:
         raise ValueError(f"DSN missing host: {dsn!r}")
     pieces = _split_host_pieces(host_part)
@@ -109,17 +144,16 @@ def parse_dsn(dsn: str) -> DSN:
     if not hosts:  # pragma: no cover — _split_host_pieces always produces ≥1 piece
         raise ValueError(f"DSN missing host: {dsn!r}")
 
-    user = unquote(parsed.username) if parsed.username else DEFAULT_USER
-    password = unquote(parsed.password) if parsed.password else ""
+    raw_user, _, raw_password = (userinfo or "").partition(":")
+    user = unquote(raw_user) if raw_user else DEFAULT_USER
+    password = unquote(raw_password) if raw_password else ""
 
-    path = parsed.path.lstrip("/")
+    path = path.lstrip("/")
     database = unquote(path) if path else DEFAULT_DATABASE
 
-    compression = _parse_compression(_take_one(query, "compression", ""))
+    compression = _parse_compression(query.get("compression", ""))
 
-    connect_timeout_str = _take_one(
-        query, "connect_timeout", str(DEFAULT_CONNECT_TIMEOUT)
-    )
+    connect_timeout_str = query.get("connect_timeout", str(DEFAULT_CONNECT_TIMEOUT))
     try:
         connect_timeout = float(connect_timeout_str)
     except ValueError as exc:
@@ -130,7 +164,7 @@ def parse_dsn(dsn: str) -> DSN:
         raise ValueError(f"connect_timeout must be positive, got {connect_timeout}")
 
     consumed = {"secure", "compression", "connect_timeout"}
-    settings = {k: v[-1] for k, v in query.items() if k not in consumed}
+    settings = {k: v for k, v in query.items() if k not in consumed}
 
     return DSN(
         hosts=tuple(hosts),
@@ -151,6 +185,12 @@ def _split_host_pieces(s: str) -> list[str]:
     """Split a multi-host string on top-level commas, respecting `[...]`
     brackets so an IPv6 literal's internal colons / commas don't get
     confused for a separator."""
+    if "[" not in s:
+        # No IPv6 literal: a plain split is exact. A stray `]` still
+        # needs the bracket-balance check below.
+        if "]" in s:
+            raise ValueError(f"unbalanced ']' in DSN host list {s!r}")
+        return s.split(",")
     pieces: list[str] = []
     current: list[str] = []
     depth = 0
@@ -190,12 +230,13 @@ def _parse_host_piece(piece: str, *, default_port: int) -> tuple[str, int]:
             port = _parse_port(rest[1:], piece)
         else:
             raise ValueError(f"unexpected text after IPv6 host literal: {piece!r}")
-    elif ":" in piece:
-        host, port_str = piece.rsplit(":", 1)
-        port = _parse_port(port_str, piece)
     else:
-        host = piece
-        port = default_port
+        host, sep, port_str = piece.rpartition(":")
+        if sep:
+            port = _parse_port(port_str, piece)
+        else:
+            host = port_str
+            port = default_port
     host = unquote(host)
     if not host:
         raise ValueError(f"DSN host piece is empty: {piece!r}")
@@ -212,14 +253,20 @@ def _parse_port(s: str, piece: str) -> int:
     return port
 
 
-def _take_one(query: dict[str, list[str]], key: str, default: str) -> str:
-    """Take the last value for `key` (a multi-valued query is ambiguous;
-    last-value matches what most parsers do). Returns `default` if the
-    key is missing."""
-    values = query.get(key)
-    if not values:
-        return default
-    return values[-1]
+def _parse_query(raw: str) -> dict[str, str]:
+    """Decode an `a=1&b=2` query string into a flat `str → str` map.
+
+    A repeated key keeps its last value (a multi-valued query is
+    ambiguous; last-value matches what most parsers do). A bare `key`
+    with no `=` maps to `""`, like `parse_qs(keep_blank_values=True)`.
+    """
+    query: dict[str, str] = {}
+    for pair in raw.split("&"):
+        if not pair:
+            continue
+        key, _, value = pair.partition("=")
+        query[unquote_plus(key)] = unquote_plus(value)
+    return query
 
 
 def _parse_bool(s: str) -> bool:
@@ -235,6 +282,10 @@ def _parse_compression(s: str) -> CompressionMethod | None:
     lowered = s.strip().lower()
     if lowered == "":
         return None  # not specified → auto-detect at connection time
+    # Deferred: `protocol.compression` pulls in the whole block/codec
+    # stack, which a DSN that never names a compression doesn't need.
+    from clickhouse_async.protocol.compression import CompressionMethod  # noqa: PLC0415
+
     if lowered in ("none", "off", "false"):
         return CompressionMethod.NONE
     if lowered == "lz4":
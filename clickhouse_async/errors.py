@@ -11,6 +11,31 @@ class ProtocolError(ClickHouseError):
     """Wire data violated the ClickHouse protocol."""
 
 
+class BufferUnderflow(Exception):  # noqa: N818 — sentinel, not an Error
+    """Raised when a sync reader is asked for more bytes than the
+    buffer holds. Caught by `read_block_buffered` so it can pull
+    another compressed frame / socket chunk and retry the parse.
+
+    Carries `needed` (bytes still wanted) and `available` (bytes
+    remaining in the current buffer) so the outer wrapper can size
+    the next pull intelligently.
+
+    Internal control flow, not part of the `ClickHouseError`
+    hierarchy. It lives here rather than in `protocol/io_sync.py`
+    because the `_fast_read` extension resolves it at init: a leaf
+    module both sides import keeps that free of an import cycle.
+    """
+
+    __slots__ = ("available", "needed")
+
+    def __init__(self, *, needed: int, available: int) -> None:
+        super().__init__(
+            f"sync reader needs {needed} bytes but only {available} are buffered"
+        )
+        self.needed = needed
+        self.available = available
+
+
 class ConnectError(ClickHouseError):
     """Every candidate host in a multi-host DSN failed to connect.
 
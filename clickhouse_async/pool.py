@@ -28,10 +28,11 @@ import asyncio
 import contextlib
 import dataclasses
 import logging
+import random
 import time
 from collections import deque
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from clickhouse_async._host_rotation import _HostRotation
 from clickhouse_async.client import Client, ColumnarBlock, ColumnarResult, QueryResult
@@ -53,15 +54,24 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+# Each pooled entry gets its own Ping threshold, drawn from
+# `[health_check_after, health_check_after * (1 + this)]`. Clients
+# returned together in a burst would otherwise all cross the threshold
+# on the same tick and Ping back-to-back on the next burst of acquires.
+_HEALTH_CHECK_JITTER = 0.25
+
 
 @dataclass
 class _PoolEntry:
     """A pooled client plus the metadata the pool uses for health
-    checks (`last_returned_at`) and lifetime caps (`opened_at`)."""
+    checks (`last_returned_at`, `health_check_after`) and lifetime
+    caps (`opened_at`)."""
 
     client: Client
     opened_at: float
     last_returned_at: float
+    # This entry's jittered Ping threshold — see `_HEALTH_CHECK_JITTER`.
+    health_check_after: float
 
 
 class Pool:
@@ -136,11 +146,16 @@ class Pool:
         self._connect_timeout = connect_timeout
         self._rotation = _HostRotation(self._dsn.hosts, cooldown=host_failover_cooldown)
 
-        # FIFO deque + Condition: the reaper needs to scan entries by
+        # Deque + Condition: the reaper needs to scan entries by
         # last_returned_at without consuming them, which Queue can't do.
         # Condition gives us the wakeup signalling Queue did for free —
         # release notifies, acquire wait_for()s, the per-waiter ordering
-        # falls out of asyncio's FIFO future scheduling.
+        # falls out of asyncio's FIFO future scheduling. Entries are
+        # handed out LIFO: release appends on the right and acquire pops
+        # from the right, so the most recently used (warmest) socket is
+        # reused first — it's the least likely to need a health-check
+        # Ping — while surplus connections age at the left end, where
+        # the reaper's idle sweep finds them.
         self._free: deque[_PoolEntry] = deque()
         self._cond: asyncio.Condition = asyncio.Condition()
         # Open + opening connections. Bumped under the cond's lock before
@@ -205,7 +220,7 @@ class Pool:
             entry: _PoolEntry | None = None
             async with self._cond:
                 if self._free:
-                    entry = self._free.popleft()
+                    entry = self._free.pop()
                     action = "verify"
                 elif self._size < self._max_size:
                     self._size += 1
@@ -233,6 +248,11 @@ class Pool:
             # / opens.
             if action == "verify":
                 assert entry is not None
+                # Steady-state fast path: an entry that needs neither a
+                # Ping nor a recycle skips the coroutine round-trip
+                # through `_verify_or_discard`.
+                if self._entry_verdict(entry, time.monotonic()) == "ready":
+                    return entry.client
                 healthy = await self._verify_or_discard(entry)
                 if healthy is not None:
                     return healthy
@@ -246,36 +266,39 @@ class Pool:
                     self._cond.notify_all()
                 raise
 
+    def _entry_verdict(
+        self, entry: _PoolEntry, now: float
+    ) -> Literal["ready", "ping", "discard"]:
+        """Classify a pooled entry: hand it out as-is, Ping it first, or
+        discard it. Shared by `_acquire`'s fast path and
+        `_verify_or_discard` so the two can't disagree."""
+        # Lifetime cap: connections older than max_lifetime are recycled
+        # on the way *out* of the pool too — defends against
+        # session-timeout surprises and DNS rotation. Connections marked
+        # BROKEN are normally discarded on release already.
+        if now - entry.opened_at > self._max_lifetime or not entry.client.is_alive:
+            return "discard"
+        # Health check via Ping/Pong if the entry has been idle long
+        # enough that the socket might have been quietly closed.
+        if now - entry.last_returned_at >= entry.health_check_after:
+            return "ping"
+        return "ready"
+
     async def _verify_or_discard(self, entry: _PoolEntry) -> Client | None:
         """Return the underlying client if the entry passes the health
         check (and isn't past its lifetime cap). Otherwise close it,
         decrement size, and return `None` so the caller loops back
         to acquire again."""
-        now = time.monotonic()
-
-        # Lifetime cap: connections older than max_lifetime are recycled
-        # on the way *out* of the pool too — defends against
-        # session-timeout surprises and DNS rotation.
-        if now - entry.opened_at > self._max_lifetime:
+        verdict = self._entry_verdict(entry, time.monotonic())
+        if verdict == "discard":
             await self._discard(entry.client)
             return None
-
-        if (
-            not entry.client.is_alive
-        ):  # pragma: no cover — connections marked BROKEN are discarded on release
-            await self._discard(entry.client)
-            return None
-
-        # Health check via Ping/Pong if the entry has been idle long
-        # enough that the socket might have been quietly closed.
-        idle_for = now - entry.last_returned_at
-        if idle_for >= self._health_check_after:
+        if verdict == "ping":
             try:
                 await entry.client.ping()
             except (ClickHouseError, OSError):
                 await self._discard(entry.client)
                 return None
-
         return entry.client
 
     async def _discard(self, client: Client) -> None:
@@ -313,10 +336,16 @@ class Pool:
                     client=client,
                     opened_at=opened_at,
                     last_returned_at=now,
+                    health_check_after=self._jittered_health_check_after(),
                 )
             )
             self._cond.notify()
 
+    def _jittered_health_check_after(self) -> float:
+        base = self._health_check_after
+        # Not security-sensitive: this only spreads Ping timing.
+        return base + random.uniform(0.0, base * _HEALTH_CHECK_JITTER)  # noqa: S311
+
     def _opened_at_for(self, client: Client) -> float:
         """Read the per-client `_pool_opened_at` annotation that
         `_open_client` stamps on freshly-minted clients. Falls back
@@ -476,6 +505,7 @@ class Pool:
                         client=client,
                         opened_at=warm_now,
                         last_returned_at=warm_now,
+                        health_check_after=self._jittered_health_check_after(),
                     )
                 )
                 self._cond.notify()
@@ -670,7 +700,9 @@ def create_pool(
       (`max_lifetime`) are sufficient. Default `True`.
     - `health_check_after`: idle connections older than this are
       pinged on the way out of the pool; failed pings → discard +
-      open fresh.
+      open fresh. Each pooled connection's threshold is jittered up
+      to 25% above this so a burst of returns doesn't Ping in
+      lock-step.
     - `host_failover_cooldown`: for multi-host DSNs, how long
       (seconds) to skip a host that just failed before considering it
       again. Best-effort: if every host is in cooldown the rotation
@@ -51,7 +51,7 @@ _BLOCK_INFO_FIELD_BUCKET_NUM = 2
 _BLOCK_INFO_FIELD_OUT_OF_ORDER_BUCKETS = 3  # vector<Int32>, added at 54480
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockInfo:
     """The numbered metadata fields preceding every Block on the wire.
 
@@ -64,7 +64,7 @@ class BlockInfo:
     bucket_num: int = -1
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnSpec:
     """The per-column header inside a Block: its name, type-spec string
     (verbatim from the wire), and the codec instantiated from that
@@ -75,7 +75,7 @@ class ColumnSpec:
     codec: ColumnCodec
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     """A columnar batch — header metadata plus the per-column data."""
 
@@ -151,13 +151,15 @@ def read_block(
     n_rows = reader.read_varuint()
     columns: list[ColumnSpec] = []
     data: list[list[Any]] = []
+    # Loop-invariant: resolve the per-column `has_custom` gate once.
+    has_custom_flag = revision >= DBMS_MIN_REVISION_WITH_CUSTOM_SERIALIZATION
     for _ in range(n_columns):
         name = reader.read_string()
         type_spec = reader.read_string()
         codec = parse_type(
             type_spec, session_timezone=session_timezone, json_nested=json_nested
         )
-        if revision >= DBMS_MIN_REVISION_WITH_CUSTOM_SERIALIZATION:
+        if has_custom_flag:
             has_custom = reader.read_byte()
             if has_custom == 1:
                 column_data = _read_custom_serialised_column(
@@ -265,22 +265,25 @@ async def read_block_buffered(
     `json_nested` flows through to configure `JSON` codecs to
     return nested dicts on read.
     """
-    buf = bytearray()
+    # `data` stays an immutable `bytes` end to end: the codecs parse it
+    # in place, and the unconsumed tail is pushed back by offset. The
+    # one-read common case makes no copy of the block's bytes at all;
+    # only a refill concatenates.
     if compression == CompressionMethod.NONE:
         # Drain whatever's currently buffered without over-asking past
         # what the server has emitted — a small one-shot DATA packet
         # would deadlock if we blocked for a fixed minimum. The cap is
         # set high enough that typical large blocks arrive in one read.
-        buf.extend(await reader.read_available(_UNCOMPRESSED_INITIAL_CAP))
+        data = await reader.read_available(_UNCOMPRESSED_INITIAL_CAP)
         refill = _refill_uncompressed
     else:  # pragma: no cover — requires extras
         # Compressed framing is self-describing; drain at least one
         # frame before the first parse attempt.
-        buf.extend(await CompressedBlockReader(reader).read_payload())
+        data = await CompressedBlockReader(reader).read_payload()
         refill = _refill_compressed
 
     while True:
-        sync = SyncBinaryReader(bytes(buf))
+        sync = SyncBinaryReader(data)
         try:
             block = read_block(
                 sync,
@@ -289,35 +292,48 @@ async def read_block_buffered(
                 json_nested=json_nested,
             )
         except BufferUnderflow as exc:
-            await refill(reader, buf, exc.needed)
+            data += await refill(reader, exc.needed - exc.available)
             continue
         # Hand the bytes our codec didn't consume back to the reader
         # so the next packet sees them at the head of its read queue.
-        leftover = bytes(buf[sync.position :])
-        if leftover:
-            reader.push_back(leftover)
+        reader.push_back(data, sync.position)
         return block
 
 
-async def _refill_uncompressed(
-    reader: AsyncBinaryReader, buf: bytearray, needed: int
-) -> None:
-    """Top up `buf` from the raw socket by exactly `needed` bytes —
-    the size of the read that just underflowed. Reading any more
-    risks blocking past what the server has emitted (a small one-shot
-    DATA packet would deadlock waiting for bytes that aren't coming);
-    the outer retry loop will call us again if the next parse pass
-    needs even more."""
-    buf.extend(await reader.read_exact(needed))
+async def _refill_uncompressed(reader: AsyncBinaryReader, missing: int) -> bytes:
+    """Return at least the `missing` bytes the parse just ran short
+    of, plus whatever else is already buffered (up to
+    `_UNCOMPRESSED_INITIAL_CAP`).
+
+    Every refill restarts the parse from the top of the block, so a
+    refill sized to the one short read (a single string, say) turns a
+    block larger than the first drain quadratic. The missing bytes
+    are guaranteed to arrive — the block isn't finished without them —
+    so blocking for them is safe; beyond that we only take what has
+    already landed, never waiting on bytes the server hasn't emitted.
+    Any overshoot into the next packet is pushed back as usual."""
+    chunks: list[bytes] = []
+    got = 0
+    while got < missing:
+        chunk = await reader.read_available(
+            max(missing - got, _UNCOMPRESSED_INITIAL_CAP)
+        )
+        if not chunk:
+            raise ProtocolError(
+                f"short read at offset {reader.position}: stream closed "
+                f"with {missing - got} bytes of the block outstanding"
+            )
+        chunks.append(chunk)
+        got += len(chunk)
+    return chunks[0] if len(chunks) == 1 else b"".join(chunks)
 
 
 async def _refill_compressed(
     reader: AsyncBinaryReader,
-    buf: bytearray,
     needed: int,  # kept to match the refill signature; unused here
-) -> None:  # pragma: no cover — requires extras
+) -> bytes:  # pragma: no cover — requires extras
     del needed
-    """Top up `buf` by exactly one compressed frame. The `needed`
+    """Return exactly one more decompressed frame. The `needed`
     argument is unused here: the outer `read_block_buffered` retry
     loop re-parses after each refill and will call us again if more
     bytes are still missing. Looping over multiple frames inside
@@ -325,8 +341,7 @@ async def _refill_compressed(
     frame plus the bytes we *already* have is enough — we'd then
     pull the next packet's raw header and misinterpret it as a
     compressed frame."""
-    frame = await CompressedBlockReader(reader).read_payload()
-    buf.extend(frame)
+    return await CompressedBlockReader(reader).read_payload()
 
 
 def write_block_framed(
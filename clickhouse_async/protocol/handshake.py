@@ -51,6 +51,7 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import clickhouse_async
+from clickhouse_async.protocol.io import BinaryWriter
 from clickhouse_async.protocol.packets import (
     DBMS_MIN_PROTOCOL_VERSION_WITH_CHUNKED_PACKETS,
     DBMS_MIN_PROTOCOL_VERSION_WITH_PASSWORD_COMPLEXITY_RULES,
@@ -67,7 +68,7 @@ from clickhouse_async.protocol.packets import (
 )
 
 if TYPE_CHECKING:
-    from clickhouse_async.protocol.io import AsyncBinaryReader, BinaryWriter
+    from clickhouse_async.protocol.io import AsyncBinaryReader
 
 CLIENT_NAME = "clickhouse-async"
 
@@ -86,7 +87,22 @@ CLIENT_VERSION_MAJOR, CLIENT_VERSION_MINOR = _split_version(
 )
 
 
-@dataclass
+def _encode_hello_prefix() -> bytes:
+    writer = BinaryWriter()
+    writer.write_varuint(ClientPacket.HELLO)
+    writer.write_string(CLIENT_NAME)
+    writer.write_varuint(CLIENT_VERSION_MAJOR)
+    writer.write_varuint(CLIENT_VERSION_MINOR)
+    writer.write_varuint(OUR_REVISION)
+    return writer.getvalue()
+
+
+# Everything in the client Hello ahead of the credentials is fixed for
+# the process, so it's encoded once at import rather than per connect.
+_HELLO_PREFIX = _encode_hello_prefix()
+
+
+@dataclass(slots=True)
 class ServerInfo:
     """The server identity captured from its Hello reply."""
 
@@ -107,11 +123,7 @@ def write_client_hello(
     database: str,
 ) -> None:
     """Append the client Hello packet (id + body) to `writer`."""
-    writer.write_varuint(ClientPacket.HELLO)
-    writer.write_string(CLIENT_NAME)
-    writer.write_varuint(CLIENT_VERSION_MAJOR)
-    writer.write_varuint(CLIENT_VERSION_MINOR)
-    writer.write_varuint(OUR_REVISION)
+    writer.write_raw(_HELLO_PREFIX)
     writer.write_string(database)
     writer.write_string(user)
     writer.write_string(password)
@@ -10,11 +10,21 @@ to keep packets atomic on the wire.
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING, TypeVar
 
+from clickhouse_async import _fast_read
 from clickhouse_async.errors import ProtocolError
+from clickhouse_async.protocol.io_sync import BufferUnderflow, SyncBinaryReader
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
 
 # ceil(64 / 7) — the longest LEB128 unsigned encoding for a u64.
 _VARUINT_MAX_BYTES = 10
+# Shift of the last of those bytes; only its lowest payload bit fits.
+_VARUINT_LAST_SHIFT = (_VARUINT_MAX_BYTES - 1) * 7
 # LEB128 / varuint: bit 7 of each byte is the "continuation" marker;
 # the low 7 bits hold the payload.
 _VARUINT_CONTINUATION_BIT = 0x80
@@ -59,19 +69,24 @@ class AsyncBinaryReader:
     def _pushback_remaining(self) -> int:
         return len(self._pushback) - self._pushback_pos
 
-    def push_back(self, data: bytes) -> None:
-        """Stash bytes the codec layer drained but didn't consume back
-        at the front of the read queue. Subsequent reads pull from
-        pushback before the underlying stream."""
-        if not data:
+    def push_back(self, data: bytes, start: int = 0) -> None:
+        """Stash `data[start:]` — bytes the codec layer drained but
+        didn't consume — back at the front of the read queue.
+        Subsequent reads pull from pushback before the underlying
+        stream.
+
+        Passing the whole drained buffer plus the parse position, rather
+        than a slice, lets the common case (nothing else queued) adopt
+        the buffer as-is instead of copying the tail."""
+        if start >= len(data):
             return
         if self._pushback_pos == len(self._pushback):
             self._pushback = data
-            self._pushback_pos = 0
+            self._pushback_pos = start
         else:
-            self._pushback = data + self._pushback[self._pushback_pos :]
+            self._pushback = data[start:] + self._pushback[self._pushback_pos :]
             self._pushback_pos = 0
-        self._pos -= len(data)
+        self._pos -= len(data) - start
 
     async def read_exact(self, n: int) -> bytes:
         if n == 0:
@@ -134,6 +149,56 @@ class AsyncBinaryReader:
         self._pos += len(chunk)
         return chunk
 
+    async def read_parsed(
+        self, parse: Callable[[SyncBinaryReader], _T], *, max_size: int
+    ) -> _T:
+        """Decode a short packet body with a synchronous `parse`.
+
+        Small bodies made of several varints (Progress, ProfileInfo,
+        the server Hello) cost one `await` per field when read field by
+        field. Here the bytes already sitting in the pushback / stream
+        buffer are parsed in place instead, with no per-field await or
+        copy. On `BufferUnderflow` exactly the missing bytes are read
+        — never more than the server has emitted — and the parse
+        restarts. Bytes the parse didn't consume stay queued for the
+        next read.
+
+        `max_size` caps how much is pulled off the stream when the
+        pushback is empty; size it to the body's worst-case encoding.
+        """
+        while True:
+            if self._pushback_pos == len(self._pushback):
+                chunk = await self._stream.read(max_size)
+                if not chunk:
+                    raise ProtocolError(
+                        f"short read at offset {self._pos}: stream closed"
+                    )
+                self._pushback = chunk
+                self._pushback_pos = 0
+            start = self._pushback_pos
+            sync = SyncBinaryReader(self._pushback, start)
+            try:
+                value = parse(sync)
+            except BufferUnderflow as exc:
+                missing = exc.needed - exc.available
+                try:
+                    more = await self._stream.readexactly(missing)
+                except asyncio.IncompleteReadError as eof:
+                    raise ProtocolError(
+                        f"short read at offset {self._pos}: "
+                        f"wanted {missing} bytes, got {len(eof.partial)}"
+                    ) from eof
+                self._pushback = self._pushback[start:] + more
+                self._pushback_pos = 0
+                continue
+            consumed = sync.position - start
+            self._pushback_pos = sync.position
+            if self._pushback_pos == len(self._pushback):
+                self._pushback = b""
+                self._pushback_pos = 0
+            self._pos += consumed
+            return value
+
     async def read_byte(self) -> int:
         data = await self.read_exact(1)
         return data[0]
@@ -142,11 +207,78 @@ class AsyncBinaryReader:
         data = await self.read_exact(width)
         return int.from_bytes(data, byteorder="little", signed=signed)
 
+    def try_read_small_varuint(self) -> int | None:
+        """Return a single-byte varuint straight from the pushback, or
+        `None` when one isn't already buffered there.
+
+        Packet ids and most counts fit in one byte, and after a
+        buffered Block / `read_parsed` drain the next packet's id
+        usually sits in the pushback — so the caller skips building and
+        awaiting a `read_varuint` coroutine. `None` means "fall back to
+        `await read_varuint()`"; nothing is consumed in that case.
+        """
+        pos = self._pushback_pos
+        pushback = self._pushback
+        if pos == len(pushback):
+            return None
+        b = pushback[pos]
+        if b & _VARUINT_CONTINUATION_BIT:
+            return None
+        pos += 1
+        if pos == len(pushback):
+            self._pushback = b""
+            self._pushback_pos = 0
+        else:
+            self._pushback_pos = pos
+        self._pos += 1
+        return b
+
+    def try_skip_empty_string(self) -> bool:
+        """Consume an empty length-prefixed string (a lone `0x00`) from
+        the pushback and return `True`; return `False` without
+        consuming anything if the next buffered byte isn't one.
+
+        The external-table name that opens every block-bearing packet
+        is almost always empty; this lets the caller skip the awaited
+        `read_string` round-trip for it.
+        """
+        pos = self._pushback_pos
+        if pos == len(self._pushback) or self._pushback[pos]:
+            return False
+        self.try_read_small_varuint()
+        return True
+
     async def read_varuint(self) -> int:
+        small = self.try_read_small_varuint()
+        if small is not None:
+            return small
+        # A multi-byte varuint sitting whole in the pushback decodes in
+        # one C call instead of an awaited `read_byte` per byte. One
+        # that straddles the end of the pushback falls through to the
+        # byte loop, which picks up the rest off the stream; so does an
+        # overlong one, so its error names the stream offset.
+        start = self._pushback_pos
+        if start != len(self._pushback):
+            try:
+                value, end = _fast_read.decode_varuint(self._pushback, start)
+            except (BufferUnderflow, ProtocolError):
+                pass
+            else:
+                if end == len(self._pushback):
+                    self._pushback = b""
+                    self._pushback_pos = 0
+                else:
+                    self._pushback_pos = end
+                self._pos += end - start
+                return value
         result = 0
         shift = 0
         for _ in range(_VARUINT_MAX_BYTES):
             b = await self.read_byte()
+            # Same UInt64 bound as the C decoder: the 10th byte (bit
+            # 63) may only carry its lowest payload bit.
+            if shift == _VARUINT_LAST_SHIFT and b & _VARUINT_PAYLOAD_MASK > 1:
+                raise ProtocolError(f"varuint exceeds 64 bits at offset {self._pos}")
             result |= (b & 0x7F) << shift
             if not (b & 0x80):
                 return result
@@ -186,9 +318,20 @@ class BinaryWriter:
     def getvalue(self) -> bytes:
         return bytes(self._buf)
 
-    def write_raw(self, data: bytes) -> None:
+    def getbuffer(self) -> memoryview:
+        """Zero-copy view of the packet built so far.
+
+        For handing a large packet (an INSERT Data block) to the
+        transport without `getvalue`'s full copy. The writer must not
+        be appended to while the view is alive — the bytearray can't
+        resize under an export."""
+        return memoryview(self._buf)
+
+    def write_raw(self, data: bytes | bytearray | memoryview) -> None:
         """Append raw bytes with no framing — used by column codecs flushing
-        bulk-packed buffers (struct.pack, null masks, etc.)."""
+        bulk-packed buffers (struct.pack, null masks, etc.). Accepts any
+        bytes-like buffer, so a codec can hand over its local `bytearray`
+        without a `bytes(...)` copy."""
         self._buf.extend(data)
 
     def write_byte(self, b: int) -> None:
@@ -198,6 +341,11 @@ class BinaryWriter:
         self._buf.extend(value.to_bytes(width, byteorder="little", signed=signed))
 
     def write_varuint(self, value: int) -> None:
+        # Packet ids, flags and most lengths fit in one byte: one
+        # compare and an append, no loop setup.
+        if 0 <= value < _VARUINT_CONTINUATION_BIT:
+            self._buf.append(value)
+            return
         if value < 0:
             raise ValueError(f"varuint cannot be negative: {value}")
         while value >= _VARUINT_CONTINUATION_BIT:
@@ -19,33 +19,17 @@ nearly identical to its async predecessor.
 
 from __future__ import annotations
 
-from clickhouse_async.errors import ProtocolError
+from clickhouse_async import _fast_read
+from clickhouse_async.errors import BufferUnderflow, ProtocolError
 
-# Mirrors `protocol/io.py`'s constants — duplicated rather than
+# Mirrors `protocol/io.py`'s constant — duplicated rather than
 # imported across modules to keep the sync path's import chain small
 # (no transitive `asyncio`).
-_VARUINT_MAX_BYTES = 10
 _VARUINT_CONTINUATION_BIT = 0x80
 
-
-class BufferUnderflow(Exception):  # noqa: N818 — sentinel, not an Error
-    """Raised when a sync reader is asked for more bytes than the
-    buffer holds. Caught by `read_block_buffered` so it can pull
-    another compressed frame / socket chunk and retry the parse.
-
-    Carries `needed` (bytes still wanted) and `available` (bytes
-    remaining in the current buffer) so the outer wrapper can size
-    the next pull intelligently.
-    """
-
-    __slots__ = ("available", "needed")
-
-    def __init__(self, *, needed: int, available: int) -> None:
-        super().__init__(
-            f"sync reader needs {needed} bytes but only {available} are buffered"
-        )
-        self.needed = needed
-        self.available = available
+# `BufferUnderflow` is defined in `errors` (the `_fast_read` init
+# resolves it there) and re-exported so codecs import it from here.
+__all__ = ["BufferUnderflow", "SyncBinaryReader"]
 
 
 class SyncBinaryReader:
@@ -76,30 +60,36 @@ class SyncBinaryReader:
         return data
 
     def read_byte(self) -> int:
-        return self.read_exact(1)[0]
+        # Index the buffer directly: a one-byte `read_exact` slice
+        # allocates a `bytes` only to take its first element.
+        pos = self._pos
+        if pos >= len(self._buf):
+            raise BufferUnderflow(needed=1, available=0)
+        self._pos = pos + 1
+        return self._buf[pos]
 
     def read_int(self, width: int, *, signed: bool) -> int:
         return int.from_bytes(self.read_exact(width), byteorder="little", signed=signed)
 
     def read_varuint(self) -> int:
-        result = 0
-        shift = 0
-        for _ in range(_VARUINT_MAX_BYTES):
-            b = self.read_byte()
-            result |= (b & 0x7F) << shift
-            if not (b & _VARUINT_CONTINUATION_BIT):
-                return result
-            shift += 7
-        raise ProtocolError(
-            f"varuint exceeds {_VARUINT_MAX_BYTES} bytes at offset {self._pos}"
-        )
+        # The C decoder finds the terminator over an 8-byte word rather
+        # than one `read_byte` call per byte; same underflow / length
+        # cap semantics as the loop it replaces.
+        value, self._pos = _fast_read.decode_varuint(self._buf, self._pos)
+        return value
 
     def read_string(self) -> str:
+        # Decode straight off the buffer slice instead of going through
+        # `read_exact` — block headers call this for every column name
+        # and type, and the extra method call is most of the overhead.
         n = self.read_varuint()
         start = self._pos
-        data = self.read_exact(n)
+        end = start + n
+        if end > len(self._buf):
+            raise BufferUnderflow(needed=n, available=len(self._buf) - start)
+        self._pos = end
         try:
-            return data.decode("utf-8")
+            return self._buf[start:end].decode("utf-8")
         except UnicodeDecodeError as exc:
             raise ProtocolError(
                 f"invalid UTF-8 in length-prefixed string at offset {start}"
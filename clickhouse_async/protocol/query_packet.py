@@ -25,6 +25,7 @@ the documented order.
 from __future__ import annotations
 
 from enum import IntEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from clickhouse_async.protocol._client_env import _safe_hostname, _safe_os_user
@@ -35,6 +36,7 @@ from clickhouse_async.protocol.handshake import (
     CLIENT_VERSION_MAJOR,
     CLIENT_VERSION_MINOR,
 )
+from clickhouse_async.protocol.io import BinaryWriter
 from clickhouse_async.protocol.packets import (
     DBMS_MIN_PROTOCOL_VERSION_WITH_DISTRIBUTED_DEPTH,
     DBMS_MIN_PROTOCOL_VERSION_WITH_INITIAL_QUERY_START_TIME,
@@ -55,8 +57,6 @@ from clickhouse_async.protocol.packets import (
 if TYPE_CHECKING:
     from collections.abc import Mapping
 
-    from clickhouse_async.protocol.io import BinaryWriter
-
 
 class QueryStage(IntEnum):
     """Stages a query is processed up to. v0 always sends `COMPLETE`."""
@@ -86,6 +86,11 @@ class _QueryKind(IntEnum):
 _SETTING_FLAG_IMPORTANT = 0x01
 _PARAM_FLAG_CUSTOM = 0x02
 
+# Bound on the per-revision / per-compression caches of constant packet
+# fragments below. A process talks to a handful of server revisions at
+# most; the cap only guards against pathological churn.
+_STATIC_BYTES_CACHE_SIZE = 32
+
 
 def _write_client_info(
     writer: BinaryWriter,
@@ -111,6 +116,20 @@ def _write_client_info(
         # Int64 microseconds since the Unix epoch — 0 means unset
         writer.write_int(0, 8, signed=True)
 
+    writer.write_raw(_client_info_tail(revision))
+
+
+@lru_cache(maxsize=_STATIC_BYTES_CACHE_SIZE)
+def _client_info_tail(revision: int) -> bytes:
+    """Serialised `ClientInfo` fields after `initial_address` and the
+    start time: the interface, this client's identity, and the
+    revision-gated zero defaults.
+
+    None of them vary per query, so they're encoded once per revision
+    rather than re-walked field by field (and the OS user / hostname
+    re-queried) on every query.
+    """
+    writer = BinaryWriter()
     writer.write_byte(_Interface.TCP)
 
     # TCP-specific block
@@ -144,6 +163,7 @@ def _write_client_info(
 
     if revision >= DBMS_MIN_REVISON_WITH_JWT_IN_INTERSERVER:
         writer.write_byte(0)  # have_jwt = 0 (no JWT token)
+    return writer.getvalue()
 
 
 def write_query_packet(
@@ -202,6 +222,14 @@ def write_query_packet(
     # for INSERTs the caller follows it with real Data packets.
     # Must be framed with the connection's compression when compression is
     # on — the server expects all client-to-server blocks to be compressed.
+    writer.write_raw(_empty_data_packet(revision, compression))
+
+
+@lru_cache(maxsize=_STATIC_BYTES_CACHE_SIZE)
+def _empty_data_packet(revision: int, compression: CompressionMethod) -> bytes:
+    """The trailing empty Data packet, encoded once per revision and
+    compression method."""
+    writer = BinaryWriter()
     writer.write_varuint(ClientPacket.DATA)
     writer.write_string("")  # external table name (empty = main table)
     write_block_framed(
@@ -210,3 +238,4 @@ def write_query_packet(
         revision=revision,
         compression=compression,
     )
+    return writer.getvalue()
@@ -18,6 +18,7 @@ Layouts pinned against upstream:
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING
 
 from clickhouse_async.protocol.compression import (
@@ -34,6 +35,12 @@ from clickhouse_async.protocol.packets import (
 if TYPE_CHECKING:
     from clickhouse_async.protocol.block import Block
     from clickhouse_async.protocol.io import AsyncBinaryReader
+    from clickhouse_async.protocol.io_sync import SyncBinaryReader
+
+# Worst-case encoded body sizes: every field a 10-byte varuint (plus
+# the three single-byte flags in ProfileInfo).
+_PROGRESS_MAX_SIZE = 7 * 10
+_PROFILE_INFO_MAX_SIZE = 5 * 10 + 3
 
 
 @dataclass
@@ -72,23 +79,36 @@ class ProfileInfo:
 
 
 async def read_progress(reader: AsyncBinaryReader, *, revision: int) -> ProgressInfo:
-    read_rows = await reader.read_varuint()
-    read_bytes = await reader.read_varuint()
-    total_rows_to_read = await reader.read_varuint()
+    return await reader.read_parsed(
+        partial(_parse_progress, revision=revision), max_size=_PROGRESS_MAX_SIZE
+    )
+
+
+async def read_profile_info(reader: AsyncBinaryReader, *, revision: int) -> ProfileInfo:
+    return await reader.read_parsed(
+        partial(_parse_profile_info, revision=revision),
+        max_size=_PROFILE_INFO_MAX_SIZE,
+    )
+
+
+def _parse_progress(reader: SyncBinaryReader, *, revision: int) -> ProgressInfo:
+    read_rows = reader.read_varuint()
+    read_bytes = reader.read_varuint()
+    total_rows_to_read = reader.read_varuint()
 
     total_bytes_to_read = 0
     if revision >= DBMS_MIN_PROTOCOL_VERSION_WITH_TOTAL_BYTES_IN_PROGRESS:
-        total_bytes_to_read = await reader.read_varuint()
+        total_bytes_to_read = reader.read_varuint()
 
     written_rows = 0
     written_bytes = 0
     if revision >= DBMS_MIN_REVISION_WITH_CLIENT_WRITE_INFO:
-        written_rows = await reader.read_varuint()
-        written_bytes = await reader.read_varuint()
+        written_rows = reader.read_varuint()
+        written_bytes = reader.read_varuint()
 
     elapsed_ns = 0
     if revision >= DBMS_MIN_PROTOCOL_VERSION_WITH_SERVER_QUERY_TIME_IN_PROGRESS:
-        elapsed_ns = await reader.read_varuint()
+        elapsed_ns = reader.read_varuint()
 
     return ProgressInfo(
         read_rows=read_rows,
@@ -101,21 +121,21 @@ async def read_progress(reader: AsyncBinaryReader, *, revision: int) -> Progress
     )
 
 
-async def read_profile_info(reader: AsyncBinaryReader, *, revision: int) -> ProfileInfo:
-    rows = await reader.read_varuint()
-    blocks = await reader.read_varuint()
-    bytes_ = await reader.read_varuint()
-    applied_limit = (await reader.read_byte()) != 0
-    rows_before_limit = await reader.read_varuint()
+def _parse_profile_info(reader: SyncBinaryReader, *, revision: int) -> ProfileInfo:
+    rows = reader.read_varuint()
+    blocks = reader.read_varuint()
+    bytes_ = reader.read_varuint()
+    applied_limit = reader.read_byte() != 0
+    rows_before_limit = reader.read_varuint()
     # `unused_obsolete_field` (UInt8) — historically `calculated_rows_before_limit`,
     # now consumed and discarded by upstream.
-    await reader.read_byte()
+    reader.read_byte()
 
     applied_aggregation = False
     rows_before_aggregation = 0
     if revision >= DBMS_MIN_REVISION_WITH_ROWS_BEFORE_AGGREGATION:
-        applied_aggregation = (await reader.read_byte()) != 0
-        rows_before_aggregation = await reader.read_varuint()
+        applied_aggregation = reader.read_byte() != 0
+        rows_before_aggregation = reader.read_varuint()
 
     return ProfileInfo(
         rows=rows,
@@ -157,7 +177,7 @@ async def read_block_packet_body(
     return nested dicts on read when the session requests it.
     """
 
-    table_name = await reader.read_string()
+    table_name = "" if reader.try_skip_empty_string() else await reader.read_string()
     block = await read_block_buffered(
         reader,
         revision=revision,
@@ -13,13 +13,15 @@ them would be circular.)
 The three codec factories that are circular (`Dynamic`, `JSON`,
 `Variant`) are looked up via thin deferred factory functions.  Their
 imports happen at first call, not at module load time.  These three
-`# noqa: PLC0415` annotations are the only ones in the package and
+`# noqa: PLC0415` annotations are the only ones in `types/` and
 are intentionally concentrated here rather than scattered across the
 codec modules.
 """
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from clickhouse_async.types.aggregate import AggregateFunction
@@ -153,6 +155,17 @@ _NULLARY: dict[str, Callable[[], ColumnCodec]] = {
     "UUID": UUID,
 }
 
+# Nullary codecs carry no per-call state, so each is built once here
+# and shared by every spec that names it rather than re-instantiated
+# per column per block. Left out: the deferred `Dynamic` / `JSON`
+# factories (their modules import this one) and `DateTime`, whose
+# bare form picks up the parse-time session timezone.
+_SHARED_NULLARY: dict[str, ColumnCodec] = {
+    name: factory()
+    for name, factory in _NULLARY.items()
+    if name not in ("DateTime", "Dynamic", "JSON")
+}
+
 # Each factory takes the heterogeneous params list and either returns a codec
 # or raises ValueError for the wrong shape. Many of these forward to a
 # helper defined below; the lambdas defer the name lookup until call time
@@ -286,6 +299,21 @@ _MAP_PARAM_COUNT = 2
 _DECIMAL_PARAM_COUNT = 2
 _DT64_MAX_PARAMS = 2  # DateTime64(precision[, 'timezone'])
 
+# Distinct (spec, session_timezone, json_nested) keys kept parsed. Every
+# block header re-sends each column's type string, and a workload
+# queries the same handful of schemas over and over.
+_PARSE_CACHE_SIZE = 1024
+
+# Token scanners for the parser's hot loops: one C-level match per
+# token instead of a Python-level loop per character.
+_WS_RE = re.compile(r" +")
+_IDENTIFIER_RE = re.compile(r"\w+")
+_INTEGER_RE = re.compile(r"-?\d+")
+# A JSON hint's body runs up to the next `,` / `)`; AggregateFunction's
+# literal-args block only cares about where the next paren sits.
+_HINT_BODY_RE = re.compile(r"[^,)]+")
+_PAREN_RE = re.compile(r"[()]")
+
 
 # ---- parser ---------------------------------------------------------------
 
@@ -308,8 +336,22 @@ def parse_type(
     constructed from this spec to return nested dicts on read instead
     of flat dotted-path dicts.
 
+    Codecs hold no per-call state once built, so parsed specs are
+    memoised: a repeated spec returns the same codec instance.
+
     Raises `ValueError` for unknown type names or malformed specs.
     """
+    shared = _SHARED_NULLARY.get(spec)
+    if shared is not None:
+        return shared
+    return _parse_type_cached(spec, session_timezone, json_nested)
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_type_cached(
+    spec: str, session_timezone: str | None, json_nested: bool
+) -> ColumnCodec:
+    """Uncached parse. Errors propagate and are not memoised."""
     return _Parser(
         spec, session_timezone=session_timezone, json_nested=json_nested
     ).parse_top()
@@ -420,6 +462,9 @@ class _Parser:
         if name == "JSON":
             # Bare `JSON` (no parens) — needs json_nested threaded in.
             return _factory_json(json_nested=self.json_nested)
+        shared = _SHARED_NULLARY.get(name)
+        if shared is not None:
+            return shared
         factory_n = _NULLARY.get(name)
         if factory_n is None:
             raise ValueError(f"unknown type: {name!r}")
@@ -540,16 +585,11 @@ class _Parser:
                 self._read_quoted_string()
             else:
                 # `SKIP some.dotted.path` — consume up to comma / paren
-                while self.pos < len(self.spec) and self.spec[self.pos] not in (
-                    ",",
-                    ")",
-                ):
-                    self.pos += 1
+                self._skip_hint_body()
             return self.spec[start : self.pos].rstrip()
         # `identifier=integer` form. We don't validate the identifier
         # name here — upstream rejects unknown ones server-side.
-        while self.pos < len(self.spec) and self.spec[self.pos] not in (",", ")"):
-            self.pos += 1
+        self._skip_hint_body()
         return self.spec[start : self.pos].rstrip()
 
     def _parse_dynamic_max_types_param(self) -> int:
@@ -594,18 +634,13 @@ class _Parser:
             # Walk balanced parens. The literal args may contain
             # commas, dots, spaces — anything except an unmatched
             # closing paren.
+            # Jump paren to paren rather than stepping per character.
             depth = 0
-            while self.pos < len(self.spec):
-                ch = self.spec[self.pos]
-                if ch == "(":
-                    depth += 1
-                elif ch == ")":
-                    depth -= 1
-                    self.pos += 1
-                    if depth == 0:
-                        break
-                    continue
-                self.pos += 1
+            while (paren := _PAREN_RE.search(self.spec, self.pos)) is not None:
+                self.pos = paren.end()
+                depth += 1 if paren.group() == "(" else -1
+                if depth == 0:
+                    break
             if depth != 0:
                 raise ValueError(
                     "unterminated AggregateFunction function-call "
@@ -682,32 +717,32 @@ class _Parser:
         self.pos += 1
 
     def _skip_ws(self) -> None:
-        while self.pos < len(self.spec) and self.spec[self.pos] == " ":
-            self.pos += 1
+        match = _WS_RE.match(self.spec, self.pos)
+        if match is not None:
+            self.pos = match.end()
+
+    def _skip_hint_body(self) -> None:
+        match = _HINT_BODY_RE.match(self.spec, self.pos)
+        if match is not None:
+            self.pos = match.end()
 
     def _read_identifier(self) -> str:
-        start = self.pos
-        while self.pos < len(self.spec):
-            c = self.spec[self.pos]
-            if c.isalnum() or c == "_":
-                self.pos += 1
-            else:
-                break
-        if start == self.pos:
+        match = _IDENTIFIER_RE.match(self.spec, self.pos)
+        if match is None:
             raise ValueError(
-                f"expected identifier at position {start} in {self.spec!r}"
+                f"expected identifier at position {self.pos} in {self.spec!r}"
             )
-        return self.spec[start : self.pos]
+        self.pos = match.end()
+        return match.group()
 
     def _read_integer(self) -> int:
-        start = self.pos
-        if self._peek() == "-":
-            self.pos += 1
-        while self.pos < len(self.spec) and self.spec[self.pos].isdigit():
-            self.pos += 1
-        if start == self.pos or (start + 1 == self.pos and self.spec[start] == "-"):
-            raise ValueError(f"expected integer at position {start} in {self.spec!r}")
-        return int(self.spec[start : self.pos])
+        match = _INTEGER_RE.match(self.spec, self.pos)
+        if match is None:
+            raise ValueError(
+                f"expected integer at position {self.pos} in {self.spec!r}"
+            )
+        self.pos = match.end()
+        return int(match.group())
 
     def _read_quoted_string(self) -> str:
         # ClickHouse uses single-quoted strings; doubled quotes are not
@@ -715,9 +750,8 @@ class _Parser:
         # syntax). We accept the simplest form for v0.
         self._consume("'")
         start = self.pos
-        while self.pos < len(self.spec) and self.spec[self.pos] != "'":
-            self.pos += 1
-        if self.pos >= len(self.spec):
+        self.pos = self.spec.find("'", start)
+        if self.pos == -1:
             raise ValueError(
                 f"unterminated string literal starting at position {start - 1} "
                 f"in {self.spec!r}"
@@ -97,6 +97,8 @@ class AggregateFunction:
     the bytes through Python.
     """
 
+    __slots__ = ("arg_types", "function_call", "function_name", "name")
+
     null_value: bytes = b""
     python_type: type = bytes
 
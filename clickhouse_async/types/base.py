@@ -37,8 +37,14 @@ class ColumnCodec(Protocol):
     `str`, `datetime`).
     """
 
-    name: str
-    null_value: Any
+    # Read-only members: slotted codecs define these either as class
+    # constants (`name = "Int32"`) or as instance slots, and a
+    # Protocol attribute would demand both be writable.
+    @property
+    def name(self) -> str: ...  # pragma: no cover — Protocol stub
+
+    @property
+    def null_value(self) -> object: ...  # pragma: no cover — Protocol stub
 
     def read(
         self, reader: SyncBinaryReader, n_rows: int
@@ -13,18 +13,28 @@
 from __future__ import annotations
 
 import struct
+from itertools import accumulate, chain, islice, pairwise
+from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, cast
 
 from clickhouse_async.errors import ProtocolError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Mapping, Sequence
 
     from clickhouse_async.protocol.io import BinaryWriter
     from clickhouse_async.protocol.io_sync import SyncBinaryReader
     from clickhouse_async.types.base import ColumnCodec
 
 
+# Placeholders for a row-level `None` in `Array` / `Nested` / `Map`.
+# Parsed codec trees are cached process-wide, so `null_value` is shared
+# by every query on the same type spec and must not be mutable — a
+# caller appending to a handed-out `[]` would corrupt later writes and
+# sparse reads.
+_EMPTY_MAP: Mapping[Any, Any] = MappingProxyType({})
+
+
 class Nullable:
     """Wraps another codec, prefixing the column body with a 1-byte-per-row
     null mask (`0` = not null, `1` = null).
@@ -34,6 +44,8 @@ class Nullable:
     in place of `None` before delegating.
     """
 
+    __slots__ = ("inner", "name", "python_type")
+
     null_value: None = None
     # Forward the inner codec's `python_type` so `Variant`
     # resolution sees the wrapped concrete type — `Nullable(Int64)`
@@ -51,13 +63,21 @@ class Nullable:
             return []
         mask = reader.read_exact(n_rows)
         values = self.inner.read(reader, n_rows)
-        return [None if mask[i] else values[i] for i in range(n_rows)]
+        # A column without nulls (the common case) needs no merge —
+        # `bytes.count` settles that in one C-level scan.
+        if mask.count(0) == n_rows:
+            return values
+        return [None if m else v for m, v in zip(mask, values, strict=True)]
 
     def write(self, writer: BinaryWriter, values: Sequence[Any]) -> None:
         n = len(values)
         if n == 0:
             return
-        writer.write_raw(bytes(1 if v is None else 0 for v in values))
+        mask = bytes([v is None for v in values])
+        writer.write_raw(mask)
+        if mask.count(0) == n:
+            self.inner.write(writer, values)
+            return
         replaced: list[Any] = [
             self.inner.null_value if v is None else v for v in values
         ]
@@ -74,13 +94,15 @@ class Array:
     back into per-row arrays.
     """
 
-    null_value: list[Any]
+    __slots__ = ("inner", "name", "null_value")
+
+    null_value: tuple[()]
     python_type: type = list
 
     def __init__(self, inner: ColumnCodec) -> None:
         self.inner = inner
         self.name = f"Array({inner.name})"
-        self.null_value = []
+        self.null_value = ()
 
     def read(self, reader: SyncBinaryReader, n_rows: int) -> list[list[Any]]:
         if n_rows == 0:
@@ -89,14 +111,11 @@ class Array:
         # struct rather than a per-row `int.from_bytes`.
         offsets_data = reader.read_exact(8 * n_rows)
         offsets = struct.unpack(f"<{n_rows}Q", offsets_data)
-        total = offsets[-1]
-        flat = self.inner.read(reader, total)
-        out: list[list[Any]] = []
-        prev = 0
-        for end in offsets:
-            out.append(list(flat[prev:end]))
-            prev = end
-        return out
+        flat = self.inner.read(reader, offsets[-1])
+        # `flat` is a fresh list the inner codec built in one bulk
+        # read, so slicing it already hands each row its own list —
+        # no per-row copy on top.
+        return [flat[start:end] for start, end in pairwise((0, *offsets))]
 
     def write(
         self, writer: BinaryWriter, values: Sequence[Sequence[Any] | None]
@@ -111,15 +130,9 @@ class Array:
             self.null_value if v is None else v for v in values
         ]
         # Cumulative offsets — bulk-pack as UInt64 LE in one struct call.
-        offsets: list[int] = []
-        running = 0
-        for row in rows:
-            running += len(row)
-            offsets.append(running)
-        writer.write_raw(struct.pack(f"<{len(offsets)}Q", *offsets))
+        writer.write_raw(struct.pack(f"<{n}Q", *accumulate(map(len, rows))))
         # Flat inner body.
-        flat: list[Any] = [item for row in rows for item in row]
-        self.inner.write(writer, flat)
+        self.inner.write(writer, list(chain.from_iterable(rows)))
 
 
 class Tuple:
@@ -138,6 +151,8 @@ class Tuple:
     still yields plain `tuple` values.
     """
 
+    __slots__ = ("components", "name", "names", "null_value")
+
     null_value: tuple[Any, ...]
     python_type: type = tuple
 
@@ -176,10 +191,9 @@ class Tuple:
         columns: list[list[Any]] = [
             component.read(reader, n_rows) for component in self.components
         ]
-        return [
-            tuple(columns[c][i] for c in range(len(self.components)))
-            for i in range(n_rows)
-        ]
+        # Transpose the per-component columns into row tuples in one
+        # C-level `zip` rather than a generator per row.
+        return list(zip(*columns, strict=True))
 
     def write(
         self, writer: BinaryWriter, values: Sequence[Sequence[Any] | None]
@@ -192,8 +206,16 @@ class Tuple:
         rows: list[Sequence[Any]] = [
             self.null_value if v is None else v for v in values
         ]
-        for c, component in enumerate(self.components):
-            component.write(writer, [row[c] for row in rows])
+        # Check every row's width once up front so a short row fails
+        # with the tuple's name rather than an IndexError mid-column,
+        # then transpose in a single C-level `zip` pass.
+        width = len(self.components)
+        if any(len(row) != width for row in rows):
+            raise ValueError(f"{self.name} rows must have {width} components")
+        for component, column in zip(
+            self.components, zip(*rows, strict=True), strict=True
+        ):
+            component.write(writer, column)
 
 
 class Nested:
@@ -213,7 +235,9 @@ class Nested:
     same constraint via `_make_named_tuple`'s "all named" rule.
     """
 
-    null_value: list[tuple[Any, ...]]
+    __slots__ = ("_inner", "components", "name", "names", "null_value")
+
+    null_value: tuple[()]
     python_type: type = list
 
     def __init__(self, *components: ColumnCodec, names: tuple[str, ...]) -> None:
@@ -230,7 +254,7 @@ class Nested:
         self.name = "Nested({})".format(
             ", ".join(f"{n} {c.name}" for n, c in zip(names, components, strict=True))
         )
-        self.null_value = []
+        self.null_value = ()
 
     def read(
         self, reader: SyncBinaryReader, n_rows: int
@@ -251,23 +275,36 @@ class Map:
     ClickHouse Map columns aren't supposed to contain duplicate keys.
     """
 
-    null_value: dict[Any, Any]
+    __slots__ = ("_inner", "key", "name", "null_value", "value")
+
+    null_value: Mapping[Any, Any]
     python_type: type = dict
 
     def __init__(self, key: ColumnCodec, value: ColumnCodec) -> None:
         self.key = key
         self.value = value
         self.name = f"Map({key.name}, {value.name})"
-        # Reuse Array(Tuple(K, V)) for the actual wire work.
+        # Reuse Array(Tuple(K, V)) for the write-side wire work.
         self._inner: Array = Array(Tuple(key, value))
-        self.null_value = {}
+        self.null_value = _EMPTY_MAP
 
     def read(self, reader: SyncBinaryReader, n_rows: int) -> list[dict[Any, Any]]:
-        rows = self._inner.read(reader, n_rows)
-        return [dict(row) for row in rows]
+        if n_rows == 0:
+            return []
+        # Same layout as `Array(Tuple(K, V))`, but the key and value
+        # columns are zipped straight into each row's dict — no
+        # intermediate per-entry tuples or per-row lists.
+        offsets = struct.unpack(f"<{n_rows}Q", reader.read_exact(8 * n_rows))
+        total = offsets[-1]
+        keys = self.key.read(reader, total)
+        values = self.value.read(reader, total)
+        return [
+            dict(zip(keys[start:end], values[start:end], strict=True))
+            for start, end in pairwise((0, *offsets))
+        ]
 
     def write(
-        self, writer: BinaryWriter, values: Sequence[dict[Any, Any] | None]
+        self, writer: BinaryWriter, values: Sequence[Mapping[Any, Any] | None]
     ) -> None:
         # Coerce row-level `None` to the empty map, matching the
         # composite-codec convention shared with `Array` / `Tuple`.
@@ -304,6 +341,8 @@ class LowCardinality:
     irrelevant — only its presence matters for offset accounting.
     """
 
+    __slots__ = ("_inner_is_nullable", "inner", "name", "null_value", "python_type")
+
     null_value: Any
     # Forward the inner codec's `python_type` so `Variant`
     # resolution sees through the dictionary encoding.
@@ -320,6 +359,10 @@ class LowCardinality:
     # bit 10 is NeedUpdateDictionary. The low byte is the index-width
     # tag and gets OR'd in per write.
     _SERIALIZATION_BASE = 0x0000_0000_0000_0600
+    # `struct` format character per index-width tag, so the indices
+    # row is packed / unpacked in one call instead of per-row
+    # `int.from_bytes` / `int.to_bytes`.
+    _INDEX_FORMATS = ("B", "H", "I", "Q")
 
     def __init__(self, inner: ColumnCodec) -> None:
         self.inner = inner
@@ -378,13 +421,14 @@ class LowCardinality:
         index_size = self._byte_width_for_tag(index_tag)
 
         dict_size = reader.read_int(8, signed=False)
-        dict_body = self._dictionary_codec().read(reader, dict_size)
-        # Map slot 0 to None so a downstream lookup with index 0 yields
-        # null. The placeholder bytes the server wrote at slot 0 are
-        # ignored — we never expose them.
-        dictionary: list[Any] = (
-            [None, *dict_body[1:]] if self._inner_is_nullable else dict_body
-        )
+        dictionary = self._dictionary_codec().read(reader, dict_size)
+        if self._inner_is_nullable:
+            # Map slot 0 to None so a downstream lookup with index 0
+            # yields null. The placeholder bytes the server wrote at
+            # slot 0 are ignored — we never expose them. The codec
+            # handed back a fresh list, so overwrite in place rather
+            # than copying the whole dictionary.
+            dictionary[:1] = [None]
 
         idx_count = reader.read_int(8, signed=False)
         if idx_count != n_rows:
@@ -392,16 +436,10 @@ class LowCardinality:
                 f"LowCardinality indices count {idx_count} != n_rows {n_rows}"
             )
         idx_data = reader.read_exact(index_size * n_rows)
-        return [
-            dictionary[
-                int.from_bytes(
-                    idx_data[i * index_size : (i + 1) * index_size],
-                    "little",
-                    signed=False,
-                )
-            ]
-            for i in range(n_rows)
-        ]
+        indices = struct.unpack(f"<{n_rows}{self._INDEX_FORMATS[index_tag]}", idx_data)
+        # `map` over the bound `__getitem__` runs the per-row lookup in
+        # C rather than as comprehension bytecode.
+        return list(map(dictionary.__getitem__, indices))
 
     def write(self, writer: BinaryWriter, values: Sequence[Any]) -> None:
         n = len(values)
@@ -410,7 +448,7 @@ class LowCardinality:
 
         dictionary, indices = self._build_dictionary(values)
 
-        index_tag, index_size = self._index_tag_for_size(len(dictionary))
+        index_tag, _ = self._index_tag_for_size(len(dictionary))
         sertype = self._SERIALIZATION_BASE | index_tag
 
         writer.write_int(self._VERSION, 8, signed=False)
@@ -418,10 +456,7 @@ class LowCardinality:
         writer.write_int(len(dictionary), 8, signed=False)
         self._dictionary_codec().write(writer, dictionary)
         writer.write_int(n, 8, signed=False)
-        idx_buf = bytearray()
-        for i in indices:
-            idx_buf.extend(i.to_bytes(index_size, "little", signed=False))
-        writer.write_raw(bytes(idx_buf))
+        writer.write_raw(struct.pack(f"<{n}{self._INDEX_FORMATS[index_tag]}", *indices))
 
     def _build_dictionary(self, values: Sequence[Any]) -> tuple[list[Any], list[int]]:
         """Deduplicate `values` in first-seen order and return
@@ -434,31 +469,12 @@ class LowCardinality:
         wire to keep offsets aligned but is never indexed by a non-null
         row.
         """
+        # `setdefault` hands back the existing slot or claims the next
+        # one in a single dict probe; the dict's insertion order is the
+        # dictionary itself.
+        seen: dict[Any, int] = {None: 0} if self._inner_is_nullable else {}
+        indices = [seen.setdefault(v, len(seen)) for v in values]
         if self._inner_is_nullable:
             placeholder = self._dictionary_codec().null_value
-            seen: dict[Any, int] = {}
-            dictionary: list[Any] = [placeholder]
-            indices: list[int] = []
-            for v in values:
-                if v is None:
-                    indices.append(0)
-                    continue
-                idx = seen.get(v)
-                if idx is None:
-                    idx = len(dictionary)
-                    seen[v] = idx
-                    dictionary.append(v)
-                indices.append(idx)
-            return dictionary, indices
-
-        seen = {}
-        dictionary = []
-        indices = []
-        for v in values:
-            idx = seen.get(v)
-            if idx is None:
-                idx = len(dictionary)
-                seen[v] = idx
-                dictionary.append(v)
-            indices.append(idx)
-        return dictionary, indices
+            return [placeholder, *islice(seen, 1, None)], indices
+        return list(seen), indices
@@ -43,6 +43,8 @@ _DECIMAL64_BYTES = 8
 class _DecimalCodec:
     """Decimal codec parameterised by its byte width."""
 
+    __slots__ = ("_scale_factor", "name", "scale")
+
     null_value: PyDecimal = PyDecimal(0)
     python_type: type = PyDecimal
     _size: int = 0
@@ -97,18 +99,26 @@ class _DecimalCodec:
 
 
 class Decimal32(_DecimalCodec):
+    __slots__ = ()
+
     _size = 4
 
 
 class Decimal64(_DecimalCodec):
+    __slots__ = ()
+
     _size = 8
 
 
 class Decimal128(_DecimalCodec):
+    __slots__ = ()
+
     _size = 16
 
 
 class Decimal256(_DecimalCodec):
+    __slots__ = ()
+
     _size = 32
 
 
@@ -25,7 +25,9 @@ if TYPE_CHECKING:
 class _EnumCodec:
     """Common implementation for both Enum widths."""
 
-    null_value: str = ""
+    __slots__ = ("_reverse", "mapping", "name", "null_value")
+
+    null_value: str
     python_type: type = str
     _size: int = 0
 
@@ -76,8 +78,12 @@ class _EnumCodec:
 
 
 class Enum8(_EnumCodec):
+    __slots__ = ()
+
     _size = 1
 
 
 class Enum16(_EnumCodec):
+    __slots__ = ()
+
     _size = 2
@@ -37,6 +37,8 @@ if TYPE_CHECKING:
 class Point:
     """`Point` — alias for `Tuple(Float64, Float64)`."""
 
+    __slots__ = ("_inner",)
+
     name = "Point"
     null_value: tuple[float, float] = (0.0, 0.0)
     python_type: type = tuple
@@ -54,8 +56,10 @@ class Point:
 class Ring:
     """`Ring` — alias for `Array(Point)`."""
 
+    __slots__ = ("_inner",)
+
     name = "Ring"
-    null_value: list[tuple[float, float]] = []  # noqa: RUF012
+    null_value: tuple[()] = ()
     python_type: type = list
 
     def __init__(self) -> None:
@@ -73,8 +77,10 @@ class Ring:
 class Polygon:
     """`Polygon` — alias for `Array(Ring)`."""
 
+    __slots__ = ("_inner",)
+
     name = "Polygon"
-    null_value: list[list[tuple[float, float]]] = []  # noqa: RUF012
+    null_value: tuple[()] = ()
     python_type: type = list
 
     def __init__(self) -> None:
@@ -92,8 +98,10 @@ class Polygon:
 class MultiPolygon:
     """`MultiPolygon` — alias for `Array(Polygon)`."""
 
+    __slots__ = ("_inner",)
+
     name = "MultiPolygon"
-    null_value: list[list[list[tuple[float, float]]]] = []  # noqa: RUF012
+    null_value: tuple[()] = ()
     python_type: type = list
 
     def __init__(self) -> None:
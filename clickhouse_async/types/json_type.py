@@ -93,6 +93,8 @@ class JSON:
     explicitly tagged via `Dynamic.tag(value, type_spec)`.
     """
 
+    __slots__ = ("_nested", "hints", "name")
+
     null_value: ClassVar[None] = None
     python_type: ClassVar[type] = dict
 
@@ -33,6 +33,8 @@ _ZERO_IPV6 = IPv6Address(0)
 
 
 class UUID:
+    __slots__ = ()
+
     name = "UUID"
     null_value: uuid.UUID = _NIL_UUID
     python_type: type = uuid.UUID
@@ -63,6 +65,8 @@ class UUID:
 
 
 class IPv4:
+    __slots__ = ()
+
     name = "IPv4"
     null_value: IPv4Address = _ZERO_IPV4
     python_type: type = IPv4Address
@@ -83,6 +87,8 @@ class IPv4:
 
 
 class IPv6:
+    __slots__ = ()
+
     name = "IPv6"
     null_value: IPv6Address = _ZERO_IPV6
     python_type: type = IPv6Address
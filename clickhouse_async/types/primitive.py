@@ -3,8 +3,8 @@
 Two implementation paths based on width:
 
 - **≤ 64 bits** (Int{8,16,32,64}, UInt{8,16,32,64}, Float{32,64}, Bool):
-  bulk encode/decode with `struct` over the whole column buffer at
-  once.
+  bulk encode/decode over the whole column buffer at once — `struct`
+  on writes, a `memoryview.cast` on little-endian reads.
 - **128 / 256 bits**: `struct` has no format characters for these
   widths, so we use `int.from_bytes` / `int.to_bytes` per row, but
   still issue exactly one `read_exact` and one `write_raw` per batch.
@@ -13,7 +13,8 @@ Two implementation paths based on width:
 from __future__ import annotations
 
 import struct
-from typing import TYPE_CHECKING, Any
+import sys
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -21,11 +22,23 @@ if TYPE_CHECKING:
     from clickhouse_async.protocol.io import BinaryWriter
     from clickhouse_async.protocol.io_sync import SyncBinaryReader
 
+# On a little-endian host the wire layout *is* the native layout, so a
+# column body can be reinterpreted with `memoryview.cast` and turned
+# into a list in one C call — no per-batch format string for `struct`
+# to build and parse, no intermediate tuple.
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+# The `struct` format characters the ≤ 64-bit codecs use. A `Literal`
+# rather than `str` so `memoryview.cast` resolves to a typed overload.
+_StructFormat = Literal["b", "h", "i", "q", "B", "H", "I", "Q", "f", "d"]
+
 
 class _StructCodec:
     """Codec for any primitive whose Python value round-trips through a
     single `struct` format character."""
 
+    __slots__ = ()
+
     name: str = ""
     null_value: Any = 0
     # `python_type` drives `Variant` arm resolution: when a row's
@@ -33,14 +46,16 @@ class _StructCodec:
     # Subclasses override (`int` for the integer codecs, `float`
     # for the float codecs).
     python_type: type = object
-    _format: str = ""
+    _format: _StructFormat
     _size: int = 0
 
     def read(self, reader: SyncBinaryReader, n_rows: int) -> list[Any]:
         if n_rows == 0:
             return []
         data = reader.read_exact(self._size * n_rows)
-        return list(struct.unpack(f"<{n_rows}{self._format}", data))
+        if _NATIVE_LITTLE_ENDIAN:
+            return memoryview(data).cast(self._format).tolist()
+        return list(struct.unpack(f"<{n_rows}{self._format}", data))  # pragma: no cover
 
     def write(self, writer: BinaryWriter, values: Sequence[Any]) -> None:
         n = len(values)
@@ -53,6 +68,8 @@ class _StructCodec:
 
 
 class Int8(_StructCodec):
+    __slots__ = ()
+
     name = "Int8"
     null_value: int = 0
     python_type = int
@@ -61,6 +78,8 @@ class Int8(_StructCodec):
 
 
 class Int16(_StructCodec):
+    __slots__ = ()
+
     name = "Int16"
     null_value: int = 0
     python_type = int
@@ -69,6 +88,8 @@ class Int16(_StructCodec):
 
 
 class Int32(_StructCodec):
+    __slots__ = ()
+
     name = "Int32"
     null_value: int = 0
     python_type = int
@@ -77,6 +98,8 @@ class Int32(_StructCodec):
 
 
 class Int64(_StructCodec):
+    __slots__ = ()
+
     name = "Int64"
     null_value: int = 0
     python_type = int
@@ -88,6 +111,8 @@ class Int64(_StructCodec):
 
 
 class UInt8(_StructCodec):
+    __slots__ = ()
+
     name = "UInt8"
     null_value: int = 0
     python_type = int
@@ -96,6 +121,8 @@ class UInt8(_StructCodec):
 
 
 class UInt16(_StructCodec):
+    __slots__ = ()
+
     name = "UInt16"
     null_value: int = 0
     python_type = int
@@ -104,6 +131,8 @@ class UInt16(_StructCodec):
 
 
 class UInt32(_StructCodec):
+    __slots__ = ()
+
     name = "UInt32"
     null_value: int = 0
     python_type = int
@@ -112,6 +141,8 @@ class UInt32(_StructCodec):
 
 
 class UInt64(_StructCodec):
+    __slots__ = ()
+
     name = "UInt64"
     null_value: int = 0
     python_type = int
@@ -123,6 +154,8 @@ class UInt64(_StructCodec):
 
 
 class Float32(_StructCodec):
+    __slots__ = ()
+
     name = "Float32"
     null_value: float = 0.0
     python_type = float
@@ -131,6 +164,8 @@ class Float32(_StructCodec):
 
 
 class Float64(_StructCodec):
+    __slots__ = ()
+
     name = "Float64"
     null_value: float = 0.0
     python_type = float
@@ -145,6 +180,8 @@ class _BigIntCodec:
     """Codec for 128/256-bit signed or unsigned integers — outside `struct`
     format coverage, encoded per-row via `int.to_bytes`."""
 
+    __slots__ = ()
+
     name: str = ""
     null_value: int = 0
     python_type: type = int
@@ -174,24 +211,32 @@ class _BigIntCodec:
 
 
 class Int128(_BigIntCodec):
+    __slots__ = ()
+
     name = "Int128"
     _size = 16
     _signed = True
 
 
 class UInt128(_BigIntCodec):
+    __slots__ = ()
+
     name = "UInt128"
     _size = 16
     _signed = False
 
 
 class Int256(_BigIntCodec):
+    __slots__ = ()
+
     name = "Int256"
     _size = 32
     _signed = True
 
 
 class UInt256(_BigIntCodec):
+    __slots__ = ()
+
     name = "UInt256"
     _size = 32
     _signed = False
@@ -206,6 +251,8 @@ class Bool:
     expected truthiness and identity semantics.
     """
 
+    __slots__ = ()
+
     name = "Bool"
     null_value: bool = False
     python_type: type = bool
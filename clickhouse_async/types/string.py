@@ -11,7 +11,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from clickhouse_async import _fast_read
-from clickhouse_async.protocol.io_sync import _VARUINT_CONTINUATION_BIT
+from clickhouse_async.protocol.io_sync import (
+    _VARUINT_CONTINUATION_BIT,
+    BufferUnderflow,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -21,6 +24,8 @@ if TYPE_CHECKING:
 
 
 class String:
+    __slots__ = ()
+
     name = "String"
     null_value: str = ""
     python_type: type = str
@@ -57,6 +62,8 @@ class String:
 
 
 class FixedString:
+    __slots__ = ("length", "name", "null_value")
+
     null_value: bytes
     python_type: type = bytes
 
@@ -71,8 +78,14 @@ class FixedString:
         if n_rows == 0:
             return []
         n = self.length
-        data = reader.read_exact(n * n_rows)
-        return [bytes(data[i * n : (i + 1) * n]) for i in range(n_rows)]
+        size = n * n_rows
+        # Slice each row straight out of the block buffer rather than
+        # copying the whole column out first via `read_exact`.
+        buf, start = reader._buf, reader._pos
+        if start + size > len(buf):
+            raise BufferUnderflow(needed=size, available=len(buf) - start)
+        reader._pos = start + size
+        return [buf[p : p + n] for p in range(start, start + size, n)]
 
     def write(self, writer: BinaryWriter, values: Sequence[bytes]) -> None:
         n = self.length
@@ -84,5 +97,5 @@ class FixedString:
                 )
             out.extend(v)
             if len(v) < n:
-                out.extend(b"\x00" * (n - len(v)))
-        writer.write_raw(bytes(out))
+                out.extend(bytes(n - len(v)))
+        writer.write_raw(out)
@@ -167,6 +167,8 @@ class Variant:
     force arm `i` when inference picks the wrong one.
     """
 
+    __slots__ = ("components", "name")
+
     null_value: ClassVar[None] = None
     python_type: ClassVar[type] = object
 
@@ -347,6 +349,8 @@ class Dynamic:
     alphabetically to match upstream `DataTypeVariant`'s by-name sort.
     """
 
+    __slots__ = ("max_types", "name")
+
     null_value: ClassVar[None] = None
     python_type: ClassVar[type] = object
 
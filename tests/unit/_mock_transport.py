@@ -25,7 +25,7 @@ class _ScriptedWriter:
         self._buf = buf
         self._closed = False
 
-    def write(self, data: bytes) -> None:
+    def write(self, data: bytes | memoryview) -> None:
         if self._closed:
             raise ConnectionResetError("scripted writer already closed")
         self._buf.extend(data)
@@ -270,6 +270,38 @@ async def test_fetch_one_returns_first_row() -> None:
     assert row == (10,)
 
 
+async def test_fetch_one_drains_later_blocks_and_keeps_the_first_row() -> None:
+    # BEGIN: a SELECT response split over two data blocks
+    transport = ScriptedTransport()
+    transport.feed(encode_server_hello())
+    spec, _ = make_column("n", "Int32", [])
+    transport.feed(
+        encode_server_data(Block(info=BlockInfo(), columns=[spec], n_rows=0, data=[[]]))
+    )
+    for values in ([1, 2], [3]):
+        transport.feed(
+            encode_server_data(
+                Block(
+                    info=BlockInfo(), columns=[spec], n_rows=len(values), data=[values]
+                )
+            )
+        )
+    transport.feed(encode_server_end_of_stream())
+
+    # WHEN: fetching one row, then running another query on the client
+    async with connect(
+        "clickhouse://default:@host/db", transport_factory=transport
+    ) as client:
+        row = await client.fetch_one("SELECT n")
+        _two_row_select_response(transport)
+        rows = await client.fetch_all("SELECT number")
+
+    # THEN: the first block's first row comes back, and the response was
+    #       drained so the connection is ready for the next query
+    assert row == (1,)
+    assert rows == [(10,), (20,)]
+
+
 async def test_fetch_one_returns_none_for_empty_result() -> None:
     # BEGIN: a SELECT response with header only (no data rows)
     transport = ScriptedTransport()
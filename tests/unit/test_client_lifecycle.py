@@ -8,6 +8,8 @@ wrapper over `Connection`; these tests exercise the wiring.
 from __future__ import annotations
 
 import asyncio
+import subprocess
+import sys
 
 import pytest
 
@@ -141,8 +143,9 @@ async def test_ping_against_non_pong_response_breaks_connection() -> None:
         # WHEN / THEN: ping raises ProtocolError naming PONG explicitly
         with pytest.raises(ProtocolError, match="expected PONG"):
             await client.ping()
-        # Underlying connection is BROKEN
+        # Underlying connection is BROKEN and its socket already closed
         assert client._conn.state == State.BROKEN  # type: ignore[attr-defined]
+        assert transport.writer_closed()
 
 
 # ---- server_info gating ------------------------------------------------
@@ -170,3 +173,21 @@ def test_top_level_module_re_exports() -> None:
     assert hasattr(ch, "CompressionMethod")
     assert hasattr(ch, "DSN")
     assert hasattr(ch, "__version__")
+
+
+def test_top_level_import_defers_the_protocol_stack() -> None:
+    # BEGIN: a fresh interpreter, so modules cached by this test session
+    #        don't mask what `import clickhouse_async` itself pulls in
+    probe = (
+        "import sys, clickhouse_async as ch; "
+        "ch.parse_dsn('clickhouse://host/db'); "
+        "print('clickhouse_async.client' in sys.modules, 'asyncio' in sys.modules)"
+    )
+
+    # WHEN: importing the package and parsing a DSN
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+
+    # THEN: neither the client module nor asyncio has been imported yet
+    assert out.split() == ["False", "False"]
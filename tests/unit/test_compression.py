@@ -405,3 +405,69 @@ async def test_default_connection_uses_no_compression() -> None:
     assert rdr.read_string() == ""
     decoded = read_block(rdr, revision=conn.negotiated_revision)
     assert decoded.n_rows == 3
+
+
+# ---- Uncompressed buffered block reads ---------------------------------
+
+
+def _string_block_bytes(n_rows: int) -> bytes:
+    spec, vals = make_column("s", "String", [f"row-{i:04d}" for i in range(n_rows)])
+    writer = BinaryWriter()
+    write_block(
+        writer,
+        Block(info=BlockInfo(), columns=[spec], n_rows=n_rows, data=[vals]),
+        revision=OUR_REVISION,
+    )
+    return writer.getvalue()
+
+
+async def test_uncompressed_block_refills_take_whatever_is_buffered(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: a String block many times larger than the drain cap, and a
+    #        counter on how often the block is (re-)parsed
+    monkeypatch.setattr(compression_module, "_UNCOMPRESSED_INITIAL_CAP", 256)
+    data = _string_block_bytes(500)
+    parses: list[None] = []
+
+    def _counting_read_block(
+        reader: SyncBinaryReader,
+        *,
+        revision: int,
+        session_timezone: str | None = None,
+        json_nested: bool = False,
+    ) -> Block:
+        parses.append(None)
+        return read_block(
+            reader,
+            revision=revision,
+            session_timezone=session_timezone,
+            json_nested=json_nested,
+        )
+
+    monkeypatch.setattr(compression_module, "read_block", _counting_read_block)
+    reader = _async_reader_over(data + b"\x05")
+
+    # WHEN: reading the block through the buffered path
+    block = await compression_module.read_block_buffered(
+        reader, revision=OUR_REVISION, compression=CompressionMethod.NONE
+    )
+
+    # THEN: each refill pulls a full cap's worth rather than one string,
+    #       so the re-parse count tracks the block size over the cap;
+    #       the byte after the block stays queued for the next read
+    assert block.data == [[f"row-{i:04d}" for i in range(500)]]
+    assert len(parses) <= len(data) // 256 + 2
+    assert await reader.read_byte() == 0x05
+
+
+async def test_uncompressed_block_truncated_mid_body_raises_protocol_error() -> None:
+    # BEGIN: a String block whose stream closes partway through the body
+    data = _string_block_bytes(50)
+    reader = _async_reader_over(data[:-3])
+
+    # WHEN / THEN: the refill reports the short read instead of hanging
+    with pytest.raises(ProtocolError, match="short read"):
+        await compression_module.read_block_buffered(
+            reader, revision=OUR_REVISION, compression=CompressionMethod.NONE
+        )
@@ -95,6 +95,36 @@ async def test_send_data_none_writes_empty_terminator_block() -> None:
     assert after == expected.getvalue()
 
 
+async def test_send_data_last_appends_terminator_in_one_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: two IN_FLIGHT connections and the same block for each
+    separate, combined = ScriptedTransport(), ScriptedTransport()
+    conn_separate = await _open_in_flight(separate)
+    conn_combined = await _open_in_flight(combined)
+    pre = len(combined.written())
+    spec, vals = make_column("id", "Int32", [1, 2])
+    block = Block(info=BlockInfo(), columns=[spec], n_rows=2, data=[vals])
+    await conn_separate.send_data(block)
+    await conn_separate.send_data(None)
+    writes: list[int] = []
+    write = combined._writer.write
+
+    def _counting_write(data: bytes | memoryview) -> None:
+        writes.append(len(data))
+        write(data)
+
+    monkeypatch.setattr(combined._writer, "write", _counting_write)
+
+    # WHEN: sending the block with `last=True`
+    await conn_combined.send_data(block, last=True)
+
+    # THEN: the block and the terminator leave in a single write, with
+    #       the same bytes as the two separate sends
+    assert len(writes) == 1
+    assert combined.written()[pre:] == separate.written()[pre:]
+
+
 # ---- state guards -----------------------------------------------------
 
 
@@ -7,14 +7,15 @@ tests that reach an open connection feed a scripted Hello reply via
 
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING, Never
 
 import pytest
 
-from clickhouse_async.connection import Connection, State
+from clickhouse_async.connection import _TRANSITION_HISTORY, Connection, State
 
 from ._mock_transport import ScriptedTransport
-from ._scripted_packets import encode_server_hello
+from ._scripted_packets import encode_server_end_of_stream, encode_server_hello
 
 if TYPE_CHECKING:
     import ssl
@@ -53,6 +54,47 @@ async def test_open_completes_handshake_and_reaches_ready() -> None:
     assert transitions_to == [State.CONNECTING, State.READY]
 
 
+async def test_transition_history_keeps_only_the_most_recent_entries() -> None:
+    # BEGIN: an open connection that runs enough queries to overflow the
+    #        transition history
+    transport = ScriptedTransport()
+    transport.feed(encode_server_hello())
+    conn = Connection([("h", 9000)], transport_factory=transport)
+    await conn.open()
+
+    # WHEN: running each query to EndOfStream
+    for i in range(_TRANSITION_HISTORY):
+        transport.feed(encode_server_end_of_stream())
+        await conn.send_query(f"SELECT {i}")
+        async for _ in conn.iter_packets():
+            pass
+
+    # THEN: the history is capped, and its tail is the latest query
+    history = conn.transitions
+    assert len(history) == _TRANSITION_HISTORY
+    assert history[-2][1] == State.IN_FLIGHT
+    assert history[-1][1] == State.READY
+
+
+async def test_state_transitions_are_logged_at_debug(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    # BEGIN: an IDLE connection with a Hello reply queued and DEBUG
+    #        logging captured for the connection module
+    transport = ScriptedTransport()
+    transport.feed(encode_server_hello())
+    conn = Connection([("h", 9000)], transport_factory=transport)
+    caplog.set_level(logging.DEBUG, logger="clickhouse_async.connection")
+
+    # WHEN: opening the connection
+    await conn.open()
+
+    # THEN: each transition is logged with both state names
+    messages = [r.getMessage() for r in caplog.records]
+    assert any("IDLE -> CONNECTING" in m for m in messages)
+    assert any("CONNECTING -> READY" in m for m in messages)
+
+
 async def test_open_from_non_idle_state_raises() -> None:
     # BEGIN: a connection already in READY from a successful handshake
     transport = ScriptedTransport()
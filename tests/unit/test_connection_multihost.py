@@ -179,6 +179,22 @@ async def test_mixed_failure_then_success_reports_winner() -> None:
     assert transport.calls == [("a", 9000), ("b", 9000)]
 
 
+async def test_non_transport_error_propagates_without_failover() -> None:
+    # BEGIN: the first candidate's open hits a programming error rather
+    #        than a transport / server failure; the second is healthy
+    transport = _PerHostTransport()
+    transport.arm(("a", 9000), TypeError("bug in a transport factory"))
+    transport.arm(("b", 9000), encode_server_hello())
+    conn = Connection([("a", 9000), ("b", 9000)], transport_factory=transport)
+
+    # WHEN / THEN: the error surfaces as-is instead of being folded into
+    #              a ConnectError or masked by the next candidate
+    with pytest.raises(TypeError, match="bug in a transport factory"):
+        await conn.open()
+    assert transport.calls == [("a", 9000)]
+    assert conn.state == State.BROKEN
+
+
 # ---- on_host_attempt callback feeds the rotation ------------------------
 
 
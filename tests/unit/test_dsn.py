@@ -96,7 +96,7 @@ def test_ipv6_host_literal_is_unwrapped_from_brackets() -> None:
     # BEGIN / WHEN: an IPv6 literal in URL form requires bracketing
     dsn = parse_dsn("clickhouse://[::1]:9000/db")
 
-    # THEN: the host comes through without brackets (urlparse strips them)
+    # THEN: the host comes through without brackets (brackets are stripped)
     assert dsn.host == "::1"
     assert dsn.port == 9000
 
@@ -115,6 +115,28 @@ def test_trailing_slash_path_falls_back_to_default_database() -> None:
 # ---- secure / TLS -------------------------------------------------------
 
 
+@pytest.mark.parametrize(
+    "dsn",
+    [
+        "clickhouse://h:9000/db\n",
+        "clickhouse://h:9000/db\t",
+        "clickhouse://h:9000/db\r\n",
+        " clickhouse://h:9000/db",
+        "\x00clickhouse://h:9000/d\nb",
+    ],
+)
+def test_surrounding_whitespace_and_control_characters_are_dropped(dsn: str) -> None:
+    # BEGIN: a DSN as read from an env var or file — a trailing
+    #        newline / tab, leading space or NUL, an embedded newline
+    # WHEN: parsing it
+    parsed = parse_dsn(dsn)
+
+    # THEN: it parses like the clean string, the same cleanup
+    #       `urlsplit` applies
+    assert parsed.hosts == (("h", 9000),)
+    assert parsed.database == "db"
+
+
 def test_clickhouses_scheme_implies_secure_and_default_secure_port() -> None:
     # BEGIN / WHEN: the clickhouses:// scheme without explicit port
     dsn = parse_dsn("clickhouses://host")
@@ -198,6 +220,29 @@ def test_unknown_query_params_become_settings() -> None:
     assert dsn.settings == {"max_block_size": "65536", "use_nulls": "1"}
 
 
+def test_query_values_are_decoded_and_last_repeat_wins() -> None:
+    # BEGIN / WHEN: a query with a repeated key, a percent/plus-encoded
+    #               value, and a bare key with no `=`
+    dsn = parse_dsn("clickhouse://host?a=1&a=2&log_comment=hi+there%21&flag&&")
+
+    # THEN: the last repeat wins, values are form-decoded, bare keys map
+    #       to "" and empty pairs are skipped
+    assert dsn.settings == {"a": "2", "log_comment": "hi there!", "flag": ""}
+
+
+def test_repeat_parse_does_not_share_settings_dict() -> None:
+    # BEGIN: the same DSN parsed twice (the second hit comes from the cache)
+    first = parse_dsn("clickhouse://host?max_threads=2")
+    second = parse_dsn("clickhouse://host?max_threads=2")
+
+    # WHEN: the caller mutates the first result's settings
+    first.settings["max_threads"] = "8"
+
+    # THEN: the second result (and the cache behind it) is unaffected
+    assert second == parse_dsn("clickhouse://host?max_threads=2")
+    assert second.settings == {"max_threads": "2"}
+
+
 # ---- error paths --------------------------------------------------------
 
 
@@ -318,8 +363,8 @@ def test_invalid_connect_timeout_non_float_raises() -> None:
     ids=["closing_without_open", "open_without_close"],
 )
 def test_unbalanced_bracket_in_host_list_raises(host_string: str) -> None:
-    # BEGIN: raw host strings with mismatched '[' / ']' — urlparse catches
-    #        these at the URL level, so we test the helper directly
+    # BEGIN: raw host strings with mismatched '[' / ']' — tested against
+    #        the helper directly
     # WHEN: / THEN: _split_host_pieces raises on any bracket imbalance
     with pytest.raises(ValueError, match="unbalanced"):
         _split_host_pieces(host_string)
@@ -335,7 +380,7 @@ def test_unbalanced_bracket_in_host_list_raises(host_string: str) -> None:
     ids=["unterminated_ipv6", "garbage_after_bracket", "whitespace_only"],
 )
 def test_parse_host_piece_invalid_input_raises(piece: str, match: str) -> None:
-    # BEGIN: host pieces that urlparse catches before our helpers run
+    # BEGIN: host pieces that the DSN-level parse rarely produces
     # WHEN: / THEN: _parse_host_piece raises ValueError with a descriptive message
     with pytest.raises(ValueError, match=match):
         _parse_host_piece(piece, default_port=9000)
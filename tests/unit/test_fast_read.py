@@ -3,9 +3,14 @@
 The extension is a hard requirement now (no pure-Python fallback).
 These tests pin the contract:
 
-- ``_fast_read`` imports cleanly as a submodule of ``clickhouse_async``.
+- ``_fast_read`` imports cleanly as a submodule of ``clickhouse_async``,
+  exactly once, whichever module is imported first.
 - It exposes ``__version__`` and a working ``available()`` callable.
-- ``decode_strings`` and ``decode_datetime`` are exposed and callable.
+- ``decode_strings``, ``decode_datetime`` and ``decode_date`` are exposed
+  and callable; ``decode_date`` agrees with ``date.fromordinal``.
+- ``decode_datetime`` shares one object across a run of equal timestamps.
+- ``decode_varuint`` agrees with ``BinaryWriter.write_varuint`` on both
+  its 8-byte word path and its scalar tail.
 
 Round-trip parity with the codecs is covered by the regular type-suite
 tests; these tests are the canary that the wheel actually shipped the
@@ -14,7 +19,17 @@ extension.
 
 from __future__ import annotations
 
+import struct
+import subprocess
+import sys
+from datetime import UTC, date, datetime, tzinfo
+
+import pytest
+
 from clickhouse_async import _fast_read
+from clickhouse_async.errors import ProtocolError
+from clickhouse_async.protocol.io import BinaryWriter
+from clickhouse_async.protocol.io_sync import BufferUnderflow
 
 
 def test_fast_read_imports() -> None:
@@ -23,6 +38,27 @@ def test_fast_read_imports() -> None:
     assert hasattr(_fast_read, "decode_datetime")
 
 
+def test_fast_read_imported_first_initialises_once() -> None:
+    # BEGIN: a fresh interpreter that imports the extension before
+    #        anything else in the package
+    probe = (
+        "import clickhouse_async._fast_read as fr\n"
+        "from clickhouse_async import errors\n"
+        "from clickhouse_async.protocol import io_sync\n"
+        "print(io_sync._fast_read is fr)\n"
+        "print(io_sync.BufferUnderflow is errors.BufferUnderflow)\n"
+    )
+
+    # WHEN: running it
+    out = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True
+    ).stdout
+
+    # THEN: io_sync sees the same module object — no second init via an
+    #       import cycle — and re-exports the sentinel from `errors`
+    assert out.split() == ["True", "True"]
+
+
 def test_fast_read_smoke() -> None:
     # WHEN: invoking the no-op smoke-test callable
     result = _fast_read.available()
@@ -31,3 +67,96 @@ def test_fast_read_smoke() -> None:
     assert result is True
     assert isinstance(_fast_read.__version__, str)
     assert _fast_read.__version__  # non-empty
+
+
+@pytest.mark.parametrize(
+    ("value", "padding"),
+    [
+        (0, b""),
+        (127, b"\x00" * 8),
+        (300, b"\x00" * 8),
+        (2**49 - 1, b""),
+        (2**49 - 1, b"\x00" * 8),
+        (2**56 - 1, b"\x00"),
+        (2**63, b"\x00" * 8),
+        (2**64 - 1, b""),
+        (2**64 - 1, b"\x00" * 8),
+    ],
+)
+def test_decode_varuint_matches_writer(value: int, padding: bytes) -> None:
+    # BEGIN: a varuint with and without enough trailing bytes for the
+    # 8-byte word path
+    writer = BinaryWriter()
+    writer.write_varuint(value)
+    encoded = writer.getvalue()
+
+    # WHEN: decoding it from a non-zero offset
+    decoded, pos = _fast_read.decode_varuint(b"\xff" + encoded + padding, 1)
+
+    # THEN: the value round-trips and the position lands right after it
+    assert decoded == value
+    assert pos == 1 + len(encoded)
+
+
+def test_decode_varuint_short_buffer_raises_buffer_underflow() -> None:
+    # WHEN / THEN: a buffer ending on a continuation byte underflows
+    with pytest.raises(BufferUnderflow):
+        _fast_read.decode_varuint(b"\x80\x80", 0)
+
+
+@pytest.mark.parametrize(
+    ("buf", "match"),
+    [
+        (b"\x80" * 11, "exceeds 10 bytes"),
+        (b"\xff" * 9 + b"\x7f", "exceeds 64 bits"),
+        (b"\xff" * 9 + b"\x02" + b"\x00" * 8, "exceeds 64 bits"),
+    ],
+)
+def test_decode_varuint_overlong_raises_protocol_error(buf: bytes, match: str) -> None:
+    # WHEN / THEN: eleven continuation bytes exceed the 10-byte cap, and
+    #       a 10th byte carrying bits past bit 63 overflows a UInt64 —
+    #       rejected rather than truncated, with or without a tail
+    with pytest.raises(ProtocolError, match=match):
+        _fast_read.decode_varuint(buf, 0)
+
+
+@pytest.mark.parametrize(
+    ("width", "fmt", "days"),
+    [
+        (2, "H", [0, 1, 59, 60, 11016, 19000, 19000, 65535]),
+        (4, "i", [-25567, -1, 0, 59, 19000, 19000, 120529]),
+    ],
+)
+def test_decode_date_matches_fromordinal(width: int, fmt: str, days: list[int]) -> None:
+    # BEGIN: Date / Date32 day counts spanning leap days, the epoch,
+    #        both ends of each range and a repeated day
+    buf = struct.pack(f"<{len(days)}{fmt}", *days)
+    epoch = date(1970, 1, 1).toordinal()
+
+    # WHEN: decoding them in C
+    decoded = _fast_read.decode_date(buf, len(days), width)
+
+    # THEN: every row equals the pure-Python `fromordinal` answer
+    assert decoded == [date.fromordinal(epoch + d) for d in days]
+
+
+@pytest.mark.parametrize("tz", [None, UTC])
+def test_decode_datetime_reuses_objects_across_equal_timestamps(
+    tz: tzinfo | None,
+) -> None:
+    # BEGIN: UInt32 timestamps with a run of repeats and a later return
+    #        to an earlier value
+    stamps = [1_700_000_000, 1_700_000_000, 1_700_000_000, 0, 1_700_000_000]
+    buf = struct.pack(f"<{len(stamps)}I", *stamps)
+
+    # WHEN: decoding them in C, naive and aware
+    decoded = _fast_read.decode_datetime(buf, len(stamps), tz)
+
+    # THEN: every row matches `fromtimestamp`, and only adjacent repeats
+    #       share an object
+    expected = [datetime.fromtimestamp(ts, tz=UTC) for ts in stamps]
+    if tz is None:
+        expected = [dt.replace(tzinfo=None) for dt in expected]
+    assert decoded == expected
+    assert decoded[0] is decoded[1] is decoded[2]
+    assert decoded[4] is not decoded[0]
@@ -24,6 +24,7 @@ if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from clickhouse_async.connection import _WriterLike
+    from clickhouse_async.pool import _PoolEntry
 
 
 class _FreshTransports:
@@ -194,6 +195,23 @@ async def test_acquire_timeout_raises_pool_timeout_error() -> None:
             assert "in_use=1" in msg
 
 
+async def test_acquire_prefers_the_most_recently_released_client() -> None:
+    # BEGIN: a pool holding two idle clients, released first-then-second
+    async with _fresh_pool(max_size=2) as (pool, _):
+        first_cm = pool.acquire()
+        second_cm = pool.acquire()
+        first = await first_cm.__aenter__()
+        second = await second_cm.__aenter__()
+        await first_cm.__aexit__(None, None, None)
+        await second_cm.__aexit__(None, None, None)
+
+        # WHEN: acquiring again
+        async with pool.acquire() as client:
+            # THEN: the warmest (last-released) client comes back first
+            assert client is second
+            assert client is not first
+
+
 # ---- FIFO fairness ------------------------------------------------------
 
 
@@ -287,6 +305,30 @@ async def test_acquire_pings_idle_connection_after_health_check_threshold() -> N
             assert sent == bytes((ClientPacket.PING,))
 
 
+async def test_released_entries_get_jittered_health_check_thresholds(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: a pool with a 10s health-check threshold and the jitter
+    #        draw pinned to its upper bound
+    monkeypatch.setattr("clickhouse_async.pool.random.uniform", lambda _lo, hi: hi)
+    factory = _FreshTransports()
+    pool = create_pool(
+        "clickhouse://default:@host/db",
+        max_size=1,
+        health_check_after=10.0,
+        transport_factory=factory,
+    )
+    async with pool:
+        # WHEN: a client is acquired and released back into the pool
+        async with pool.acquire():
+            pass
+
+        # THEN: the pooled entry pings only after the jittered threshold,
+        #       at most 25% past the configured one
+        (entry,) = pool._free
+        assert entry.health_check_after == pytest.approx(12.5)
+
+
 async def test_acquire_discards_connection_when_ping_fails() -> None:
     # BEGIN: a pool with health_check_after=0; the idle connection's
     #        scripted server returns a non-Pong reply
@@ -314,6 +356,78 @@ async def test_acquire_discards_connection_when_ping_fails() -> None:
             assert pool.size == 1
 
 
+# ---- acquire fast path -----------------------------------------------
+
+
+async def test_acquire_fast_path_hands_out_fresh_entry_without_ping(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: a pool with a high health-check threshold and a recently
+    #        released connection in the free queue
+    factory = _FreshTransports()
+    pool = create_pool(
+        "clickhouse://default:@host/db",
+        max_size=1,
+        health_check_after=999.0,
+        transport_factory=factory,
+    )
+    async with pool:
+        async with pool.acquire():
+            pass
+        pre_written = len(factory.transports[0].written())
+        verified: list[object] = []
+
+        async def _spy(entry: object) -> None:
+            verified.append(entry)
+
+        monkeypatch.setattr(pool, "_verify_or_discard", _spy)
+
+        # WHEN: acquiring the idle connection
+        async with pool.acquire() as client:
+            # THEN: the same client comes back without a verify round-trip
+            #       and without a Ping on the wire
+            assert verified == []
+            assert len(factory.transports) == 1
+            assert client.is_alive
+            assert factory.transports[0].written()[pre_written:] == b""
+
+
+async def test_acquire_fast_path_falls_through_when_lifetime_exceeded(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: a pool with a high health-check threshold whose only idle
+    #        entry is aged past max_lifetime
+    factory = _FreshTransports()
+    pool = create_pool(
+        "clickhouse://default:@host/db",
+        max_size=1,
+        max_lifetime=60.0,
+        health_check_after=999.0,
+        transport_factory=factory,
+    )
+    async with pool:
+        async with pool.acquire():
+            pass
+        (entry,) = pool._free
+        entry.opened_at -= 120.0
+        verify = pool._verify_or_discard
+        verified: list[object] = []
+
+        async def _spy(e: _PoolEntry) -> ch.Client | None:
+            verified.append(e)
+            return await verify(e)
+
+        monkeypatch.setattr(pool, "_verify_or_discard", _spy)
+
+        # WHEN: acquiring again
+        async with pool.acquire():
+            # THEN: the fast path deferred to `_verify_or_discard`, which
+            #       discarded the stale entry and a fresh transport was minted
+            assert verified == [entry]
+            assert len(factory.transports) == 2
+            assert pool.size == 1
+
+
 # ---- lifetime cap on release -----------------------------------------
 
 
@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+from typing import TYPE_CHECKING
 
 import pytest
 
 from clickhouse_async.errors import ProtocolError
 from clickhouse_async.protocol.io import AsyncBinaryReader, BinaryWriter
 
+if TYPE_CHECKING:
+    from clickhouse_async.protocol.io_sync import SyncBinaryReader
+
 
 def _reader(data: bytes) -> AsyncBinaryReader:
     stream = asyncio.StreamReader()
@@ -89,6 +93,22 @@ async def test_varuint_too_long_raises_protocol_error() -> None:
         await reader.read_varuint()
 
 
+@pytest.mark.parametrize("buffered", [False, True])
+async def test_varuint_beyond_64_bits_raises_protocol_error(buffered: bool) -> None:
+    # BEGIN: a 10-byte varuint whose last byte carries bits past bit 63,
+    #        either fed from the stream or already sitting in the pushback
+    data = bytes([0xFF] * 9 + [0x7F])
+    reader = _reader(b"" if buffered else data)
+    if buffered:
+        reader.push_back(data)
+
+    # WHEN: reading the varuint
+    # THEN: ProtocolError flags the overflow instead of returning a
+    #       value no UInt64 can hold
+    with pytest.raises(ProtocolError, match="exceeds 64 bits"):
+        await reader.read_varuint()
+
+
 async def test_varuint_truncated_raises_protocol_error() -> None:
     # BEGIN: a stream with a continuation byte and no follower
     reader = _reader(b"\xff")
@@ -256,3 +276,168 @@ async def test_compound_round_trip() -> None:
 
     # THEN: every field round-trips and the buffer is fully consumed
     assert (a, b, c, d) == (7, "packet", 42, b"\x00\xff")
+
+
+# ---- synchronous parse over buffered bytes -------------------------------
+
+
+def _two_varuints(reader: SyncBinaryReader) -> tuple[int, int]:
+    return reader.read_varuint(), reader.read_varuint()
+
+
+async def test_read_parsed_refills_when_max_size_splits_a_field() -> None:
+    # BEGIN: two multi-byte varuints followed by a trailing string
+    writer = BinaryWriter()
+    writer.write_varuint(2**40)
+    writer.write_varuint(300)
+    writer.write_string("tail")
+    reader = _reader(writer.getvalue())
+
+    # WHEN: parsing the varuints with a read cap that cuts the first one short
+    values = await reader.read_parsed(_two_varuints, max_size=3)
+
+    # THEN: both fields decode, position counts only the parsed bytes,
+    # and the unparsed remainder is still readable in order
+    assert values == (2**40, 300)
+    assert reader.position == 8
+    assert await reader.read_string() == "tail"
+
+
+async def test_read_parsed_leaves_unconsumed_bytes_queued() -> None:
+    # BEGIN: a stream holding two varuints and a trailing byte
+    reader = _reader(b"\x01\x02\x7f")
+
+    # WHEN: parsing the varuints with a cap large enough to over-read
+    values = await reader.read_parsed(_two_varuints, max_size=64)
+
+    # THEN: the trailing byte is returned by the next ordinary read
+    assert values == (1, 2)
+    assert await reader.read_byte() == 0x7F
+
+
+async def test_read_parsed_refills_when_a_single_byte_read_runs_short() -> None:
+    # BEGIN: a stream of three single-byte fields and a read cap of one
+    reader = _reader(b"\x0a\x0b\x0c")
+
+    def _three_bytes(sync: SyncBinaryReader) -> tuple[int, int, int]:
+        return sync.read_byte(), sync.read_byte(), sync.read_byte()
+
+    # WHEN: parsing them with `read_byte`, which underflows after the first
+    values = await reader.read_parsed(_three_bytes, max_size=1)
+
+    # THEN: each underflow pulls the missing byte and the parse completes
+    assert values == (0x0A, 0x0B, 0x0C)
+    assert reader.position == 3
+
+
+async def test_read_parsed_refills_when_a_string_body_runs_short() -> None:
+    # BEGIN: two length-prefixed strings, one of them multi-byte UTF-8
+    writer = BinaryWriter()
+    writer.write_string("café")
+    writer.write_string("column_name")
+    reader = _reader(writer.getvalue())
+
+    def _two_strings(sync: SyncBinaryReader) -> tuple[str, str]:
+        return sync.read_string(), sync.read_string()
+
+    # WHEN: parsing them with a read cap that splits each body
+    values = await reader.read_parsed(_two_strings, max_size=4)
+
+    # THEN: each underflow pulls the rest of the body and both decode
+    assert values == ("café", "column_name")
+    assert reader.position == len(writer)
+
+
+async def test_read_parsed_truncated_body_raises_protocol_error() -> None:
+    # BEGIN: a stream that ends inside the second varuint
+    reader = _reader(b"\x01\x80")
+
+    # WHEN / THEN: the parse surfaces a short read rather than BufferUnderflow
+    with pytest.raises(ProtocolError, match="short read"):
+        await reader.read_parsed(_two_varuints, max_size=64)
+
+
+async def test_try_read_small_varuint_uses_only_the_pushback() -> None:
+    # BEGIN: a reader whose pushback holds a one-byte then a two-byte
+    # varuint, with more bytes still on the stream
+    reader = _reader(b"\x05")
+    reader.push_back(b"\x03\xac\x02")
+    start = reader.position
+
+    # WHEN: taking the first varuint without awaiting
+    first = reader.try_read_small_varuint()
+
+    # THEN: the one-byte value comes back, a multi-byte one is declined
+    # without consuming anything, and the awaited path picks it up
+    assert first == 3
+    assert reader.position == start + 1
+    assert reader.try_read_small_varuint() is None
+    assert await reader.read_varuint() == 300
+    assert reader.try_read_small_varuint() is None
+    assert await reader.read_varuint() == 5
+
+
+async def test_read_varuint_decodes_pushback_and_straddling_values() -> None:
+    # BEGIN: a pushback holding one whole multi-byte varuint (300) and
+    #        the first byte of another (2**14) whose tail is on the stream
+    reader = _reader(b"\x80\x01")
+    reader.push_back(b"\xac\x02\x80")
+    start = reader.position
+
+    # WHEN: reading both
+    whole = await reader.read_varuint()
+    straddling = await reader.read_varuint()
+
+    # THEN: both decode and the position counts every byte consumed
+    assert whole == 300
+    assert straddling == 2**14
+    assert reader.position == start + 5
+
+
+async def test_try_skip_empty_string_consumes_only_a_buffered_empty_string() -> None:
+    # BEGIN: a reader whose pushback holds an empty string followed by
+    #        a non-empty one
+    reader = _reader(b"")
+    reader.push_back(b"\x00\x02hi")
+
+    # WHEN / THEN: the empty string is skipped, the non-empty one is
+    #              declined untouched and still readable
+    assert reader.try_skip_empty_string() is True
+    assert reader.try_skip_empty_string() is False
+    assert await reader.read_string() == "hi"
+    assert reader.try_skip_empty_string() is False
+
+
+def test_getbuffer_views_the_packet_without_copying() -> None:
+    # BEGIN: a writer holding a small packet
+    writer = BinaryWriter()
+    writer.write_varuint(2)
+    writer.write_string("t")
+
+    # WHEN: taking a buffer view of it
+    view = writer.getbuffer()
+
+    # THEN: the view carries the same bytes as getvalue(), and the
+    #       writer refuses to grow while the view is exported
+    assert view == writer.getvalue()
+    with pytest.raises(BufferError):
+        writer.write_byte(0)
+    view.release()
+    writer.write_byte(0)
+    assert writer.getvalue() == b"\x02\x01t\x00"
+
+
+async def test_push_back_with_start_queues_only_the_tail() -> None:
+    # BEGIN: a reader with one byte still on the stream and a drained
+    #        buffer whose first two bytes were already consumed
+    reader = _reader(b"\x09")
+    drained = b"\x01\x02\x03\x04"
+
+    # WHEN: pushing the buffer back from offset 2, then reading on
+    reader.push_back(drained, 2)
+    rest = await reader.read_exact(3)
+
+    # THEN: only the unconsumed tail precedes the stream's bytes, and
+    #       position accounts for just the pushed-back tail
+    assert rest == b"\x03\x04\x09"
+    assert reader.position == 1
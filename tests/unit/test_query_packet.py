@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import pytest
 
+from clickhouse_async.protocol import query_packet
 from clickhouse_async.protocol.compression import CompressionMethod
 from clickhouse_async.protocol.io import AsyncBinaryReader, BinaryWriter
 from clickhouse_async.protocol.packets import (
@@ -70,6 +71,35 @@ async def test_write_client_info_omits_optional_field_below_threshold(
     assert len(writer.getvalue()) > 0
 
 
+async def test_write_query_packet_encodes_static_client_info_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # BEGIN: a hostname probe that counts how often it is queried
+    calls: list[None] = []
+
+    def _hostname() -> str:
+        calls.append(None)
+        return "probe-host"
+
+    monkeypatch.setattr(query_packet, "_safe_hostname", _hostname)
+    query_packet._client_info_tail.cache_clear()
+    first, second = BinaryWriter(), BinaryWriter()
+
+    # WHEN: writing the same query twice at the same revision
+    try:
+        for writer in (first, second):
+            write_query_packet(
+                writer, sql="SELECT 1", query_id="q", user="u", revision=OUR_REVISION
+            )
+    finally:
+        query_packet._client_info_tail.cache_clear()
+
+    # THEN: the static ClientInfo tail was built once and reused verbatim
+    assert len(calls) == 1
+    assert b"probe-host" in first.getvalue()
+    assert first.getvalue() == second.getvalue()
+
+
 # ---- settings write path ------------------------------------------------
 
 
@@ -43,6 +43,52 @@ def test_parse_type_recognises_nullary_names() -> None:
     assert codec.name == "Int32"
 
 
+def test_parse_type_shares_stateless_nullary_codecs() -> None:
+    # BEGIN: the same nullary type named bare and inside a wrapper
+    bare = parse_type("String")
+    wrapped = parse_type("Nullable(String)")
+
+    # WHEN / THEN: both resolve to one shared codec instance, while a
+    #       bare DateTime is still built per call for its session tz
+    assert isinstance(wrapped, Nullable)
+    assert wrapped.inner is bare
+    assert parse_type("DateTime", session_timezone="UTC") is not parse_type("DateTime")
+
+
+def test_parse_type_memoises_composite_specs_per_session_timezone() -> None:
+    # BEGIN: a composite spec parsed twice under the same session tz
+    spec = "Array(Nullable(DateTime))"
+    first = parse_type(spec, session_timezone="Europe/Berlin")
+
+    # WHEN: parsing it again, and once under a different session tz
+    again = parse_type(spec, session_timezone="Europe/Berlin")
+    other = parse_type(spec, session_timezone="UTC")
+
+    # THEN: the repeat is served from the cache; the tz is part of the key
+    assert again is first
+    assert other is not first
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "Int64",
+        "DateTime64(9)",
+        "Decimal(18, 4)",
+        "LowCardinality(Nullable(String))",
+        "Map(String, Array(Enum8('a' = 1)))",
+        "Variant(Int64, String)",
+        "JSON",
+    ],
+)
+def test_parsed_codecs_are_slotted(spec: str) -> None:
+    # BEGIN / WHEN: a codec tree parsed from a spec
+    codec = parse_type(spec)
+
+    # THEN: the codec carries no per-instance `__dict__`
+    assert not hasattr(codec, "__dict__")
+
+
 def test_parse_type_handles_nested_nullable() -> None:
     # BEGIN: a nested type spec exercising the parser's recursion
     spec = "Nullable(Int32)"
@@ -80,6 +126,9 @@ def test_parse_type_tolerates_whitespace_around_tokens() -> None:
         ("Nullable Int32", "unknown type"),
         ("Int32 trailing", "trailing characters"),
         ("", "expected identifier"),
+        ("FixedString(-)", "expected integer"),
+        ("Enum8('a", "unterminated string literal"),
+        ("AggregateFunction(quantiles((0.5)", "unterminated AggregateFunction"),
     ],
 )
 def test_parse_type_rejects_malformed_specs(spec: str, fragment: str) -> None:
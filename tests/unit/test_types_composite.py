@@ -113,13 +113,26 @@ async def test_array_write_coerces_row_level_none_to_empty_array() -> None:
     # WHEN: round-tripping
     decoded = await _round_trip(codec, values)
 
-    # THEN: each `None` lands as the codec's `null_value` (`[]`),
+    # THEN: each `None` lands as the codec's empty `null_value`,
     #       matching what the server itself does for a NULL inserted
     #       into an Array column at SQL level. The interior Nullable
     #       layer continues to handle element-level None on its own.
     assert decoded == [[], ["a", "b"], []]
 
 
+async def test_array_read_rows_are_independent_lists() -> None:
+    # BEGIN: an Array(Int32) column with two equal rows
+    codec = parse_type("Array(Int32)")
+    decoded = await _round_trip(codec, [[1, 2], [1, 2]])
+
+    # WHEN: mutating the first decoded row
+    decoded[0].append(3)
+
+    # THEN: each row is its own list — the second is untouched
+    assert decoded == [[1, 2, 3], [1, 2]]
+    assert all(type(row) is list for row in decoded)
+
+
 # ---- Tuple(T1, T2, …) ----------------------------------------------------
 
 
@@ -179,6 +192,17 @@ async def test_tuple_one_component_round_trip() -> None:
     assert decoded == values
 
 
+def test_tuple_write_rejects_rows_of_the_wrong_width() -> None:
+    # BEGIN: a Tuple(Int32, String) codec and a row missing its second field
+    codec = parse_type("Tuple(Int32, String)")
+
+    # WHEN / THEN: the write refuses before emitting any column
+    writer = BinaryWriter()
+    with pytest.raises(ValueError, match=r"Tuple\(Int32, String\) rows must have 2"):
+        codec.write(writer, [(1, "a"), (2,)])
+    assert writer.getvalue() == b""
+
+
 def test_tuple_requires_at_least_one_component() -> None:
     # BEGIN / WHEN / THEN: parsing Tuple() raises since the parser produces
     #     an empty params list and the factory rejects it
@@ -355,7 +379,7 @@ async def test_map_write_coerces_row_level_none_to_empty_map() -> None:
     # WHEN: round-tripping
     decoded = await _round_trip(codec, values)
 
-    # THEN: the None lands as the codec's `null_value` (`{}`), the
+    # THEN: the None lands as the codec's empty `null_value`, the
     #       same convention Array and Tuple now follow
     assert decoded == [{"a": 1}, {}, {"b": 2}]
 
@@ -379,6 +403,21 @@ async def test_map_wire_format_matches_array_of_tuple() -> None:
     assert map_writer.getvalue() == array_writer.getvalue()
 
 
+async def test_map_reads_array_of_tuple_bytes() -> None:
+    # BEGIN: an Array(Tuple(Int8, String)) body with an empty row between
+    #        two populated ones
+    writer = BinaryWriter()
+    parse_type("Array(Tuple(Int8, String))").write(
+        writer, [[(1, "a"), (2, "b")], [], [(3, "c")]]
+    )
+
+    # WHEN: decoding those bytes as the equivalent Map
+    decoded = parse_type("Map(Int8, String)").read(_reader(writer.getvalue()), 3)
+
+    # THEN: each row's slice of the key / value columns becomes its dict
+    assert decoded == [{1: "a", 2: "b"}, {}, {3: "c"}]
+
+
 # ---- empty-batch invariants ---------------------------------------------
 
 
@@ -402,6 +441,38 @@ async def test_empty_batch_round_trip(spec: str) -> None:
     assert decoded == []
 
 
+# ---- shared null placeholders ----------------------------------------------
+
+
+@pytest.mark.parametrize(
+    ("spec", "empty"),
+    [
+        ("Array(Int32)", []),
+        ("Nested(id Int32, s String)", []),
+        ("Map(String, Int32)", {}),
+        ("Ring", []),
+    ],
+)
+async def test_null_value_of_a_cached_codec_cannot_be_mutated(
+    spec: str, empty: list[Any] | dict[Any, Any]
+) -> None:
+    # BEGIN: a codec parsed once, then served again from the parse cache
+    first = parse_type(spec)
+    placeholder: Any = first.null_value
+
+    # WHEN: a caller tries to fill in the placeholder it was handed
+    with pytest.raises((AttributeError, TypeError)):
+        placeholder.append((1, "x"))
+    with pytest.raises(TypeError):
+        placeholder["k"] = 1
+    second = parse_type(spec)
+
+    # THEN: the cached codec is shared, and a None row still encodes
+    #       as an empty value for every later parse
+    assert second is first
+    assert await _round_trip(second, [None]) == [empty]
+
+
 # ---- name round-tripping -------------------------------------------------
 
 
@@ -124,6 +124,22 @@ async def test_low_cardinality_round_trip_dedupes() -> None:
     assert decoded == values
 
 
+def test_low_cardinality_dictionary_keeps_first_seen_order() -> None:
+    # BEGIN: a LowCardinality(String) codec and rows repeating two values
+    codec = parse_type("LowCardinality(String)")
+
+    # WHEN: encoding
+    writer = BinaryWriter()
+    codec.write(writer, ["b", "a", "b", "b", "a"])
+    encoded = writer.getvalue()
+
+    # THEN: the dictionary holds each value once, in first-seen order,
+    #       and the UInt8 index tail points every row at its slot
+    assert int.from_bytes(encoded[16:24], "little") == 2
+    assert encoded[24:28] == b"\x01b\x01a"
+    assert encoded[-5:] == bytes([0, 1, 0, 0, 1])
+
+
 async def test_low_cardinality_picks_smallest_index_width() -> None:
     # BEGIN: a small dictionary (3 unique values) with many rows
     codec = parse_type("LowCardinality(Int32)")
@@ -141,6 +157,24 @@ async def test_low_cardinality_picks_smallest_index_width() -> None:
     assert sertype & 0xFF == 0
 
 
+async def test_low_cardinality_wide_indices_round_trip() -> None:
+    # BEGIN: a dictionary too large for UInt8 indices
+    codec = parse_type("LowCardinality(UInt32)")
+    values = list(range(300)) * 2
+
+    # WHEN: encoding and decoding
+    writer = BinaryWriter()
+    codec.write(writer, values)
+    encoded = writer.getvalue()
+    decoded = codec.read(_reader(encoded), len(values))
+
+    # THEN: the indices are UInt16 (tag 1), two bytes per row at the
+    #       tail of the body, and every row maps back to its value
+    assert int.from_bytes(encoded[8:16], "little") & 0xFF == 1
+    assert encoded[-4:] == (298).to_bytes(2, "little") + (299).to_bytes(2, "little")
+    assert decoded == values
+
+
 async def test_low_cardinality_round_trip_int_values() -> None:
     # BEGIN: a LowCardinality(UInt32) codec
     codec = parse_type("LowCardinality(UInt32)")
@@ -17,7 +17,7 @@ from zoneinfo import ZoneInfo
 import pytest
 
 from clickhouse_async.protocol.io import BinaryWriter
-from clickhouse_async.protocol.io_sync import SyncBinaryReader
+from clickhouse_async.protocol.io_sync import BufferUnderflow, SyncBinaryReader
 from clickhouse_async.types import ColumnCodec, parse_type
 from clickhouse_async.types.datetime import (
     DateTime,
@@ -105,6 +105,21 @@ async def test_float32_round_trip_within_precision() -> None:
     assert decoded == values
 
 
+def test_struct_codecs_decode_little_endian_wire_bytes() -> None:
+    # BEGIN: hand-built little-endian bodies for a signed and a float codec
+    int16_body = b"\xfe\xff\x02\x01"
+    float64_body = bytes.fromhex("000000000000f83f")
+
+    # WHEN: reading them straight off the wire bytes
+    ints = parse_type("Int16").read(_reader(int16_body), 2)
+    floats = parse_type("Float64").read(_reader(float64_body), 1)
+
+    # THEN: values decode low-byte-first into plain Python lists
+    assert ints == [-2, 0x0102]
+    assert floats == [1.5]
+    assert type(ints) is list
+
+
 # ---- bool ----------------------------------------------------------------
 
 
@@ -142,6 +157,22 @@ async def test_fixed_string_round_trip_pads_short_inputs_with_nul() -> None:
     ]
 
 
+def test_fixed_string_reads_rows_in_place_and_reports_short_buffers() -> None:
+    # BEGIN: a FixedString(2) column sitting between other bytes
+    codec = FixedString(2)
+    reader = SyncBinaryReader(b"\x09abcd\x07", 1)
+
+    # WHEN: reading two rows, then asking for one more than is buffered
+    rows = codec.read(reader, 2)
+
+    # THEN: the rows are sliced at the reader's position, the cursor
+    #       lands on the trailing byte, and an overlong read underflows
+    assert rows == [b"ab", b"cd"]
+    assert reader.position == 5
+    with pytest.raises(BufferUnderflow):
+        codec.read(reader, 1)
+
+
 def test_fixed_string_rejects_over_length_input() -> None:
     # BEGIN: a FixedString(3) codec
     codec = FixedString(3)
@@ -324,6 +355,27 @@ async def test_datetime64_round_trip_at_supported_precisions(
     assert decoded == values
 
 
+@pytest.mark.parametrize("precision", [3, 8])
+def test_datetime64_naive_read_decodes_pre_epoch_ticks(precision: int) -> None:
+    # BEGIN: a naive DateTime64 codec and raw tick counts on both sides
+    #        of the epoch, including a negative sub-second fraction
+    codec = DateTime64(precision=precision, high_precision=False)
+    ticks = [-(10**precision) - 1, -1, 0, 1_756_812_345 * 10**precision + 5]
+
+    # WHEN: decoding the wire bytes
+    writer = BinaryWriter()
+    for t in ticks:
+        writer.write_raw(t.to_bytes(8, "little", signed=True))
+    decoded = codec.read(_reader(writer.getvalue()), len(ticks))
+
+    # THEN: each row floors to the microsecond below its instant
+    epoch = datetime(1970, 1, 1)
+    expected = [
+        epoch + timedelta(microseconds=t * 10**6 // 10**precision) for t in ticks
+    ]
+    assert decoded == expected
+
+
 def test_datetime64_rejects_out_of_range_precision() -> None:
     # BEGIN: a DateTime64 with an unsupported precision
     # WHEN: constructing